@@ -6,46 +6,230 @@ A command-line interface for managing the Discord Logger Bot on Railway.
 Provides commands for setup, monitoring, and maintenance.
 """
 
+import argparse
 import asyncio
+import atexit
+import getpass
+import importlib.util
 import json
+import re
 import sys
 import os
-from pathlib import Path
-from typing import Dict, Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Awaitable, Dict, Any, List, Optional, TypeVar
+from urllib.parse import urlparse
 
-import click
-try:
+if TYPE_CHECKING:
     import aiohttp
+    from badbot_discord_logger.config import Config
+    from badbot_discord_logger.database import SupabaseManager
+
+T = TypeVar("T")
+
+
+def _lazy_import(name: str) -> ModuleType:
+    """
+    Return a module that is only executed on first attribute access.
+    
+    Set CLI_EAGER_IMPORTS=1 to import everything up front, e.g. to surface
+    import errors immediately while debugging.
+    
+    Raises:
+        ImportError: If the module cannot be found
+    """
+    if os.environ.get("CLI_EAGER_IMPORTS") == "1":
+        return importlib.import_module(name)
+    
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
     from rich.console import Console
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    # Tables and progress bars are only needed by a few commands
+    rich_table = _lazy_import("rich.table")
+    rich_progress = _lazy_import("rich.progress")
 except ImportError:
-    print("Missing required dependencies. Install with: pip install click aiohttp rich")
+    print("Missing required dependencies. Install with: pip install aiohttp rich")
     sys.exit(1)
 
-# Add the src directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 try:
-    from badbot_discord_logger.config import load_config_with_overrides, get_config
-    from badbot_discord_logger.database import SupabaseManager
-except ImportError as e:
-    print(f"Error importing modules: {e}")
-    print("Make sure you've installed the dependencies with: pip install -r requirements.txt")
-    sys.exit(1)
+    # Optional faster JSON codec for bot status
+    import orjson
+except ImportError:
+    orjson = None
 
 console = Console()
 
+# Dotted hostname made of non-empty labels, e.g. "project.supabase.co"
+HOSTNAME_PATTERN = re.compile(r"^[a-z0-9-]+(\.[a-z0-9-]+)+$", re.IGNORECASE)
+
+# Environment file written by setup; placeholders are filled with format_map
+ENV_TEMPLATE = """# Discord Configuration
+logger_discord_token={token}
+
+# Supabase Configuration
+supabase_url={supabase_url}
+supabase_key={supabase_key}
+
+# Logging Configuration
+LOG_LEVEL=INFO
+ENABLE_DEBUG=false
+
+# Backfill Configuration
+BACKFILL_ENABLED=true
+BACKFILL_CHUNK_SIZE=100
+BACKFILL_DELAY_SECONDS=1.0
+BACKFILL_ON_STARTUP=false
+
+# Performance Configuration
+BATCH_SIZE=50
+MAX_QUEUE_SIZE=10000
+FLUSH_INTERVAL=30
+
+# Health Check Configuration
+HEALTH_CHECK_ENABLED=true
+
+# Message Processing Configuration
+PROCESS_BOT_MESSAGES=true
+PROCESS_SYSTEM_MESSAGES=true
+PROCESS_DM_MESSAGES=false
+"""
+
+# Static output of the docs command, rendered with a single print
+DOCS_TEXT = """[bold blue]Discord Logger Bot - Railway Edition[/bold blue]
+
+[bold yellow]Quick Start:[/bold yellow]
+1. python cli.py setup
+2. python cli.py config test
+3. python cli.py railway
+4. Deploy to Railway
+
+[bold yellow]Helpful Links:[/bold yellow]
+• Discord Developer Portal: https://discord.com/developers/applications
+• Supabase Dashboard: https://app.supabase.com
+• Railway Dashboard: https://railway.app
+
+[bold yellow]Support:[/bold yellow]
+• Check logs: railway logs
+• Monitor status: python cli.py bot status
+• Database health: python cli.py db health"""
+
+
+def _compact_json(value: Any) -> str:
+    """Serialize a value as single-line JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(',', ':'))
+
+
+class _PlainProgress:
+    """
+    Stand-in for rich's Progress when stdout is not a terminal.
+    
+    Prints each task's final description once instead of running a spinner
+    that repaints from a background thread.
+    """
+    
+    def __init__(self):
+        self._task_count = 0
+    
+    def __enter__(self) -> "_PlainProgress":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        return None
+    
+    def add_task(self, description: str, total: Optional[float] = None) -> int:
+        self._task_count += 1
+        return self._task_count
+    
+    def update(self, task_id: int, description: str) -> None:
+        console.print(description)
+
+
+def _progress():
+    """Return a spinner progress display on a terminal, plain output otherwise."""
+    if not console.is_terminal:
+        return _PlainProgress()
+    return rich_progress.Progress(
+        rich_progress.SpinnerColumn(),
+        rich_progress.TextColumn("[progress.description]{task.description}"),
+        console=console,
+    )
+
 
 class DiscordLoggerCLI:
     """Main CLI application class."""
     
-    def __init__(self):
-        self.config = None
-        self.db_manager = None
+    def __init__(self) -> None:
+        self.config: Optional["Config"] = None
+        self.db_manager: Optional["SupabaseManager"] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def run(self, coro: Awaitable[T]) -> T:
+        """
+        Run a coroutine on the CLI's event loop.
+        
+        The loop is created on first use and kept for the life of the process,
+        so commands run in sequence share it along with the HTTP session and
+        database connection bound to it. It is torn down at exit.
+        """
+        if self._loop is None:
+            from badbot_discord_logger.event_loop import configure_event_loop_policy
+            configure_event_loop_policy()
+            self._loop = asyncio.new_event_loop()
+            atexit.register(self._shutdown)
+        return self._loop.run_until_complete(coro)
+    
+    def _shutdown(self) -> None:
+        """Release the HTTP session and database connection, then close the loop."""
+        try:
+            self._loop.run_until_complete(self.close_session())
+            if self.db_manager is not None:
+                self._loop.run_until_complete(self.db_manager.close())
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        finally:
+            self._loop.close()
+            self._loop = None
+    
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+            self._session = aiohttp.ClientSession(
+                # Split budget so a stalled connect or DNS lookup fails fast
+                timeout=aiohttp.ClientTimeout(total=10, connect=2, sock_read=5),
+                # Keep connections and DNS answers around for repeated polls
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def close_session(self) -> None:
+        """Close the shared HTTP session if one was opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
-    async def load_config(self, **overrides):
+    async def load_config(self, **overrides: Any) -> bool:
         """Load configuration with optional overrides."""
+        # Imported here so commands that never touch the bot (setup, railway,
+        # docs, --help) don't pay for loading discord.py and supabase
+        try:
+            from badbot_discord_logger.config import load_config_with_overrides, get_config
+            from badbot_discord_logger.database import SupabaseManager
+        except ImportError as e:
+            console.print(f"[red]Error importing modules: {e}[/red]")
+            console.print("Make sure you've installed the package with: pip install -e .")
+            return False
+        
         try:
             if overrides:
                 self.config = load_config_with_overrides(**overrides)
@@ -61,20 +245,45 @@ class DiscordLoggerCLI:
 cli = DiscordLoggerCLI()
 
 
-@click.group()
-@click.version_option(version="1.0.0")
-def main():
-    """Discord Logger Bot Management CLI for Railway"""
-    pass
+def _env_value(*names: str) -> Optional[str]:
+    """Return the first non-empty environment variable among names."""
+    for name in names:
+        value = os.environ.get(name)
+        if value:
+            return value
+    return None
+
 
+def _prompt(label: str, hide_input: bool = False) -> str:
+    """Prompt until a non-empty value is entered."""
+    while True:
+        value = getpass.getpass(f"{label}: ") if hide_input else input(f"{label}: ")
+        if value:
+            return value
 
-@main.command()
-@click.option('--token', prompt='Discord Bot Token', help='Discord bot token', hide_input=True)
-@click.option('--supabase-url', prompt='Supabase URL', help='Supabase project URL')
-@click.option('--supabase-key', prompt='Supabase Key', help='Supabase anon key', hide_input=True)
-@click.option('--env-file', default='.env', help='Environment file path')
-def setup(token: str, supabase_url: str, supabase_key: str, env_file: str):
-    """Set up the Discord Logger Bot configuration for Railway."""
+
+def setup(args: argparse.Namespace) -> None:
+    """Set up the Discord Logger Bot configuration for Railway.
+    
+    Values already present in the environment are used as-is; only missing
+    ones are prompted for, so setup can run non-interactively.
+    """
+    token = (
+        args.token
+        or _env_value('logger_discord_token', 'LOGGER_DISCORD_TOKEN')
+        or _prompt('Discord Bot Token', hide_input=True)
+    )
+    supabase_url = (
+        args.supabase_url
+        or _env_value('supabase_url', 'SUPABASE_URL')
+        or _prompt('Supabase URL')
+    )
+    supabase_key = (
+        args.supabase_key
+        or _env_value('supabase_key', 'SUPABASE_KEY')
+        or _prompt('Supabase Key', hide_input=True)
+    )
+    env_file = args.env_file
     
     console.print("[bold blue]Setting up Discord Logger Bot for Railway...[/bold blue]")
     
@@ -83,51 +292,33 @@ def setup(token: str, supabase_url: str, supabase_key: str, env_file: str):
         console.print("[red]Error: Discord token appears to be invalid (too short)[/red]")
         return
     
-    if not supabase_url.startswith("https://"):
+    parsed_url = urlparse(supabase_url)
+    if parsed_url.scheme != "https":
         console.print("[red]Error: Supabase URL must use HTTPS[/red]")
         return
     
-    # Basic domain validation
-    domain = supabase_url[8:]  # Remove "https://"
-    if not domain or '.' not in domain or domain.endswith('.') or domain.startswith('.'):
+    # Domain validation on the parsed hostname, so ports and paths are accepted
+    if not parsed_url.hostname or not HOSTNAME_PATTERN.match(parsed_url.hostname):
         console.print("[red]Error: Supabase URL must be a valid HTTPS URL with a proper domain[/red]")
         return
     
     # Create environment file
-    env_content = f"""# Discord Configuration
-logger_discord_token={token}
-
-# Supabase Configuration
-supabase_url={supabase_url}
-supabase_key={supabase_key}
-
-# Logging Configuration
-LOG_LEVEL=INFO
-ENABLE_DEBUG=false
-
-# Backfill Configuration
-BACKFILL_ENABLED=true
-BACKFILL_CHUNK_SIZE=100
-BACKFILL_DELAY_SECONDS=1.0
-BACKFILL_ON_STARTUP=false
-
-# Performance Configuration
-BATCH_SIZE=50
-MAX_QUEUE_SIZE=10000
-FLUSH_INTERVAL=30
-
-# Health Check Configuration
-HEALTH_CHECK_ENABLED=true
-
-# Message Processing Configuration
-PROCESS_BOT_MESSAGES=true
-PROCESS_SYSTEM_MESSAGES=true
-PROCESS_DM_MESSAGES=false
-"""
+    env_content = ENV_TEMPLATE.format_map({
+        "token": token,
+        "supabase_url": supabase_url,
+        "supabase_key": supabase_key,
+    })
     
     try:
-        with open(env_file, 'w') as f:
-            f.write(env_content)
+        # Create the file owner-only, since it holds the bot token and Supabase key
+        fd = os.open(env_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            if hasattr(os, "fchmod"):
+                # O_CREAT's mode only applies to new files; tighten an existing one too
+                os.fchmod(fd, 0o600)
+            os.write(fd, env_content.encode("utf-8"))
+        finally:
+            os.close(fd)
         
         console.print(f"[green]✓ Configuration saved to {env_file}[/green]")
         console.print("\n[bold yellow]Railway Deployment Steps:[/bold yellow]")
@@ -144,24 +335,13 @@ PROCESS_DM_MESSAGES=false
         console.print(f"[red]Error writing configuration file: {e}[/red]")
 
 
-@main.group()
-def config():
-    """Configuration management commands."""
-    pass
-
-
-@config.command()
-def test():
+def config_test(args: argparse.Namespace) -> None:
     """Test the configuration and connections."""
     
     async def _test_config():
         console.print("[bold blue]Testing Discord Logger Bot configuration...[/bold blue]")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _progress() as progress:
             
             # Test configuration loading
             task1 = progress.add_task("Loading configuration...", total=None)
@@ -202,7 +382,7 @@ def test():
         
         # Display configuration summary
         if cli.config:
-            table = Table(title="Configuration Summary")
+            table = rich_table.Table(title="Configuration Summary")
             table.add_column("Setting", style="cyan")
             table.add_column("Value", style="magenta")
             
@@ -214,17 +394,10 @@ def test():
             
             console.print(table)
     
-    asyncio.run(_test_config())
+    cli.run(_test_config())
 
 
-@main.group()
-def db():
-    """Database management commands."""
-    pass
-
-
-@db.command()
-def stats():
+def db_stats(args: argparse.Namespace) -> None:
     """Show database statistics."""
     
     async def _show_stats():
@@ -236,7 +409,7 @@ def stats():
                 await cli.db_manager.initialize()
                 stats = await cli.db_manager.get_statistics()
                 
-                table = Table(title="Database Statistics")
+                table = rich_table.Table(title="Database Statistics")
                 table.add_column("Metric", style="cyan")
                 table.add_column("Value", style="magenta")
                 
@@ -250,11 +423,10 @@ def stats():
         except Exception as e:
             console.print(f"[red]Failed to get database statistics: {e}[/red]")
     
-    asyncio.run(_show_stats())
+    cli.run(_show_stats())
 
 
-@db.command()
-def health():
+def db_health(args: argparse.Namespace) -> None:
     """Check database health."""
     
     async def _check_health():
@@ -266,7 +438,7 @@ def health():
                 await cli.db_manager.initialize()
                 health = await cli.db_manager.health_check()
                 
-                table = Table(title="Database Health Check")
+                table = rich_table.Table(title="Database Health Check")
                 table.add_column("Check", style="cyan")
                 table.add_column("Status", style="magenta")
                 table.add_column("Details", style="dim")
@@ -294,21 +466,20 @@ def health():
         except Exception as e:
             console.print(f"[red]Health check failed: {e}[/red]")
     
-    asyncio.run(_check_health())
-
-
-@main.group()
-def bot():
-    """Bot management commands."""
-    pass
+    cli.run(_check_health())
 
 
-@bot.command()
-@click.option('--url', help='Bot health check URL (Railway deployment URL)')
-def status(url: str):
+def bot_status(args: argparse.Namespace) -> None:
     """Check bot status via health check endpoint."""
+    url = args.url
     
     async def _check_status():
+        try:
+            session = await cli._get_session()
+        except ImportError:
+            console.print("[red]Missing required dependencies. Install with: pip install aiohttp rich[/red]")
+            return
+        
         # Try to determine URL automatically or use provided one
         check_url = url
         if not check_url:
@@ -320,35 +491,39 @@ def status(url: str):
                 check_url = "http://localhost:8080/health"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(check_url, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        console.print("[bold green]✓ Bot is running[/bold green]")
-                        
-                        table = Table(title="Bot Status")
-                        table.add_column("Metric", style="cyan")
-                        table.add_column("Value", style="magenta")
-                        
-                        for key, value in data.items():
-                            if isinstance(value, dict):
-                                value = json.dumps(value, indent=2)
-                            table.add_row(key.replace('_', ' ').title(), str(value))
-                        
-                        console.print(table)
-                    else:
-                        console.print(f"[red]✗ Bot health check failed (HTTP {response.status})[/red]")
+            async with session.get(check_url) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read()) if orjson is not None else await response.json()
+                    console.print("[bold green]✓ Bot is running[/bold green]")
+                    
+                    table = rich_table.Table(title="Bot Status")
+                    table.add_column("Metric", style="cyan")
+                    table.add_column("Value", style="magenta")
+                    
+                    # Nested payloads render as compact single-line JSON
+                    rows = [
+                        (
+                            key.replace('_', ' ').title(),
+                            _compact_json(value) if isinstance(value, dict) else str(value)
+                        )
+                        for key, value in data.items()
+                    ]
+                    for row in rows:
+                        table.add_row(*row)
+                    
+                    console.print(table)
+                else:
+                    console.print(f"[red]✗ Bot health check failed (HTTP {response.status})[/red]")
         except Exception as e:
             console.print(f"[red]✗ Bot is not responding: {e}[/red]")
             console.print("[yellow]Make sure the bot is running and accessible[/yellow]")
             if not url:
                 console.print("[cyan]Try specifying the URL with --url option[/cyan]")
     
-    asyncio.run(_check_status())
+    cli.run(_check_status())
 
 
-@main.command()
-def railway():
+def railway(args: argparse.Namespace) -> None:
     """Show Railway deployment information."""
     
     console.print("[bold blue]Railway Deployment Guide[/bold blue]\n")
@@ -382,27 +557,67 @@ def railway():
         console.print(f"  {description}: [dim]{command}[/dim]")
 
 
-@main.command()
-def docs():
+def docs(args: argparse.Namespace) -> None:
     """Show documentation and helpful information."""
+    console.print(DOCS_TEXT)
+
+
+def _summary(func) -> str:
+    """First line of a command's docstring, used as its help text."""
+    return func.__doc__.strip().splitlines()[0]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all CLI commands."""
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Discord Logger Bot Management CLI for Railway"
+    )
+    parser.add_argument('--version', action='version', version='%(prog)s, version 1.0.0')
+    commands = parser.add_subparsers(title="commands", metavar="COMMAND")
     
-    console.print("[bold blue]Discord Logger Bot - Railway Edition[/bold blue]\n")
+    setup_parser = commands.add_parser('setup', help=_summary(setup), description=_summary(setup))
+    setup_parser.add_argument('--token', help='Discord bot token')
+    setup_parser.add_argument('--supabase-url', help='Supabase project URL')
+    setup_parser.add_argument('--supabase-key', help='Supabase anon key')
+    setup_parser.add_argument('--env-file', default='.env', help='Environment file path')
+    setup_parser.set_defaults(func=setup)
     
-    console.print("[bold yellow]Quick Start:[/bold yellow]")
-    console.print("1. python cli.py setup")
-    console.print("2. python cli.py config test") 
-    console.print("3. python cli.py railway")
-    console.print("4. Deploy to Railway")
+    # Command groups: name -> (help, [(subcommand, handler, options)])
+    groups = {
+        'config': ("Configuration management commands.", [
+            ('test', config_test, {}),
+        ]),
+        'db': ("Database management commands.", [
+            ('stats', db_stats, {}),
+            ('health', db_health, {}),
+        ]),
+        'bot': ("Bot management commands.", [
+            ('status', bot_status, {'--url': 'Bot health check URL (Railway deployment URL)'}),
+        ]),
+    }
+    for group_name, (group_help, subcommands) in groups.items():
+        group_parser = commands.add_parser(group_name, help=group_help, description=group_help)
+        group_parser.set_defaults(func=lambda args, group_parser=group_parser: group_parser.print_help())
+        group_commands = group_parser.add_subparsers(title="commands", metavar="COMMAND")
+        for name, func, options in subcommands:
+            command_parser = group_commands.add_parser(name, help=_summary(func), description=_summary(func))
+            for flag, flag_help in options.items():
+                command_parser.add_argument(flag, help=flag_help)
+            command_parser.set_defaults(func=func)
     
-    console.print("\n[bold yellow]Helpful Links:[/bold yellow]")
-    console.print("• Discord Developer Portal: https://discord.com/developers/applications")
-    console.print("• Supabase Dashboard: https://app.supabase.com")
-    console.print("• Railway Dashboard: https://railway.app")
+    for func in (railway, docs):
+        command_parser = commands.add_parser(func.__name__, help=_summary(func), description=_summary(func))
+        command_parser.set_defaults(func=func)
     
-    console.print("\n[bold yellow]Support:[/bold yellow]")
-    console.print("• Check logs: railway logs")
-    console.print("• Monitor status: python cli.py bot status")
-    console.print("• Database health: python cli.py db health")
+    parser.set_defaults(func=lambda args: parser.print_help())
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parse command-line arguments and run the selected command."""
+    args = build_parser().parse_args(argv)
+    args.func(args)
 
 
 if __name__ == "__main__":
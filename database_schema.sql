@@ -61,8 +61,9 @@ CREATE INDEX IF NOT EXISTS idx_discord_messages_guild_id ON discord_messages (gu
 CREATE INDEX IF NOT EXISTS idx_discord_messages_author_id ON discord_messages (author_id);
 CREATE INDEX IF NOT EXISTS idx_discord_messages_created_at ON discord_messages (created_at);
 CREATE INDEX IF NOT EXISTS idx_discord_messages_logged_at ON discord_messages (logged_at);
-CREATE INDEX IF NOT EXISTS idx_discord_messages_is_backfilled ON discord_messages (is_backfilled);
+CREATE INDEX IF NOT EXISTS idx_discord_messages_backfilled_created ON discord_messages (created_at) WHERE is_backfilled;
 CREATE INDEX IF NOT EXISTS idx_discord_messages_webhook_id ON discord_messages (webhook_id);
+CREATE INDEX IF NOT EXISTS idx_discord_messages_channel_created ON discord_messages (channel_id, created_at DESC) INCLUDE (message_id);
 
 -- Table for storing Discord actions/events
 CREATE TABLE IF NOT EXISTS discord_actions (
@@ -101,7 +102,7 @@ CREATE INDEX IF NOT EXISTS idx_discord_actions_guild_id ON discord_actions (guil
 CREATE INDEX IF NOT EXISTS idx_discord_actions_channel_id ON discord_actions (channel_id);
 CREATE INDEX IF NOT EXISTS idx_discord_actions_user_id ON discord_actions (user_id);
 CREATE INDEX IF NOT EXISTS idx_discord_actions_occurred_at ON discord_actions (occurred_at);
-CREATE INDEX IF NOT EXISTS idx_discord_actions_is_backfilled ON discord_actions (is_backfilled);
+CREATE INDEX IF NOT EXISTS idx_discord_actions_backfilled_occurred ON discord_actions (occurred_at) WHERE is_backfilled;
 
 -- Table for tracking processing checkpoints
 CREATE TABLE IF NOT EXISTS discord_checkpoints (
@@ -267,6 +268,21 @@ LEFT JOIN discord_messages m ON c.channel_id = m.channel_id
 LEFT JOIN discord_guilds g ON c.guild_id = g.guild_id
 GROUP BY c.channel_id, c.name, g.name;
 
+-- View for the newest stored message per channel, used to resume backfill
+CREATE OR REPLACE VIEW discord_channel_last_message AS
+SELECT 
+    c.guild_id,
+    c.channel_id,
+    m.message_id
+FROM discord_channels c
+LEFT JOIN LATERAL (
+    SELECT message_id
+    FROM discord_messages
+    WHERE channel_id = c.channel_id
+    ORDER BY created_at DESC
+    LIMIT 1
+) m ON TRUE;
+
 -- View for action statistics
 CREATE OR REPLACE VIEW discord_action_stats AS
 SELECT 
@@ -2,6 +2,7 @@
 -- WARNING: This will permanently delete all data!
 
 -- Drop views first (they depend on tables)
+DROP VIEW IF EXISTS discord_channel_last_message CASCADE;
 DROP VIEW IF EXISTS action_stats CASCADE;
 DROP VIEW IF EXISTS channel_message_stats CASCADE;
 DROP VIEW IF EXISTS recent_messages CASCADE;
@@ -8,12 +8,11 @@ to a Supabase database with comprehensive backfill and checkpoint capabilities.
 
 import asyncio
 import sys
-from pathlib import Path
 
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+from loguru import logger
 
 from badbot_discord_logger import DiscordLogger
+from badbot_discord_logger.event_loop import configure_event_loop_policy
 from badbot_discord_logger.config import load_config
 
 
@@ -21,32 +20,35 @@ async def main() -> None:
     """Main entry point for the Discord Logger Bot."""
     try:
         # Load configuration
-        print("Loading configuration...")
+        logger.info("Loading configuration...")
         config = load_config()
-        print(f"Configuration loaded successfully")
-        print(f"Bot will connect to {len(config.allowed_guilds_list) if config.allowed_guilds_list else 'all'} guilds")
-        print(f"Backfill enabled: {config.backfill_enabled}")
+        allowed_guilds = config.allowed_guilds_list
+        guild_count = len(allowed_guilds) if allowed_guilds else "all"
+        logger.info(
+            f"Configuration loaded: connecting to {guild_count} guilds, "
+            f"backfill enabled: {config.backfill_enabled}"
+        )
         
         # Initialize and start bot
-        print("Initializing Discord bot...")
+        logger.info("Initializing Discord bot...")
         bot = DiscordLogger(config)
         
-        print("Starting bot...")
-        print("Press Ctrl+C to stop the bot gracefully")
+        logger.info("Starting bot (press Ctrl+C to stop gracefully)")
         
         await bot.start(config.discord_token)
         
     except KeyboardInterrupt:
-        print("\nReceived keyboard interrupt, shutting down gracefully...")
+        logger.info("Received keyboard interrupt, shutting down gracefully...")
     except Exception as e:
-        print(f"Fatal error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Fatal error: {e}")
         sys.exit(1)
     finally:
-        print("Bot shutdown complete")
+        logger.info("Bot shutdown complete")
 
 
 if __name__ == "__main__":
-    # Run the bot
+    # Pin the event loop before asyncio.run(): Proactor on Windows (the
+    # selector loop cannot spawn subprocesses), uvloop elsewhere when it is
+    # installed, otherwise the default asyncio loop
+    configure_event_loop_policy()
     asyncio.run(main()) 
\ No newline at end of file
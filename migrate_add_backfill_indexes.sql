@@ -0,0 +1,29 @@
+-- Migration: Add composite index and view for backfill resume lookups
+-- Backfill looks up the newest stored message per channel before paging
+-- Discord history. With only single-column indexes Postgres has to collect
+-- every row for the channel and sort it; this index answers the lookup with
+-- a single index-only scan.
+
+CREATE INDEX IF NOT EXISTS idx_discord_messages_channel_created
+    ON discord_messages (channel_id, created_at DESC) INCLUDE (message_id);
+
+-- Query to verify the index is used after migration
+-- EXPLAIN SELECT message_id FROM discord_messages
+--     WHERE channel_id = '123' ORDER BY created_at DESC LIMIT 1;
+
+-- View for resuming backfill: one row per known channel with the newest
+-- stored message, answered per channel from the index above. Filtering on
+-- guild_id lets backfill fetch a whole guild's resume points in one request.
+CREATE OR REPLACE VIEW discord_channel_last_message AS
+SELECT 
+    c.guild_id,
+    c.channel_id,
+    m.message_id
+FROM discord_channels c
+LEFT JOIN LATERAL (
+    SELECT message_id
+    FROM discord_messages
+    WHERE channel_id = c.channel_id
+    ORDER BY created_at DESC
+    LIMIT 1
+) m ON TRUE;
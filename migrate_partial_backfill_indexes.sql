@@ -0,0 +1,17 @@
+-- Migration: Replace boolean is_backfilled indexes with partial indexes
+-- A full index on a two-valued column is rarely used by the planner but is
+-- written on every insert. Partial indexes over backfilled rows only keep
+-- live logging writes out of them entirely, while still serving queries
+-- over backfilled data by time.
+
+DROP INDEX IF EXISTS idx_discord_messages_is_backfilled;
+DROP INDEX IF EXISTS idx_discord_actions_is_backfilled;
+
+CREATE INDEX IF NOT EXISTS idx_discord_messages_backfilled_created
+    ON discord_messages (created_at) WHERE is_backfilled;
+CREATE INDEX IF NOT EXISTS idx_discord_actions_backfilled_occurred
+    ON discord_actions (occurred_at) WHERE is_backfilled;
+
+-- Query to check index usage after migration
+-- SELECT indexrelname, idx_scan FROM pg_stat_user_indexes
+--     WHERE indexrelname LIKE '%backfilled%';
@@ -8,18 +8,47 @@ This package provides a Discord bot that can:
 - Handle backfilling of missed data
 """
 
-__version__ = "0.1.0"
-__author__ = "Your Name"
-__email__ = "your.email@example.com"
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from .bot import DiscordLogger
-from .config import Config
-from .models import MessageModel, ActionModel, CheckpointModel
+from ._version import __version__, __author__, __email__
+
+if TYPE_CHECKING:
+    from .bot import DiscordLogger
+    from .config import Config
+    from .models import MessageModel, ActionModel, CheckpointModel
+
+# Public names and the submodule defining each. They are imported on first
+# access (PEP 562) so that importing e.g. the config module does not load
+# discord.py through the bot.
+_LAZY_IMPORTS = {
+    "DiscordLogger": "bot",
+    "Config": "config",
+    "MessageModel": "models",
+    "ActionModel": "models",
+    "CheckpointModel": "models",
+}
 
 __all__ = [
     "DiscordLogger",
-    "Config", 
+    "Config",
     "MessageModel",
     "ActionModel",
     "CheckpointModel",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include the lazily imported names in dir()."""
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
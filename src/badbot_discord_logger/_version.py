@@ -0,0 +1,10 @@
+"""
+Package metadata for BadBot Discord Logger.
+
+Kept free of imports so tooling can read the version without loading the
+bot, database or Discord dependencies.
+"""
+
+__version__ = "0.1.0"
+__author__ = "Your Name"
+__email__ = "your.email@example.com"
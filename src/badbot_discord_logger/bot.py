@@ -6,12 +6,16 @@ message logging, action tracking, and backfill capabilities with checkpoint mana
 """
 
 import asyncio
+import json
 import signal
 import sys
 import os
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
-from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import partial
 import gc
 from aiohttp import web
 import aiohttp
@@ -20,11 +24,167 @@ import discord
 from discord.ext import commands, tasks
 from loguru import logger
 
+try:
+    # Optional, only used for the memory usage stat
+    import psutil
+except ImportError:
+    psutil = None
+
 from .config import Config, get_config
-from .database import SupabaseManager, DatabaseError
+from .database import SupabaseManager, DatabaseError, NonRetryableError
 from .models import ActionType
 
 
+# Log line formats; the colored one is only used on an interactive terminal
+CONSOLE_LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
+PLAIN_LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+
+# A queue-full warning is logged for the first dropped item and every this many after
+DROP_WARNING_EVERY = 1000
+
+# The root endpoint never changes, so serialize it once instead of per request
+ROOT_RESPONSE_BODY = json.dumps({
+    "name": "Discord Logger Bot",
+    "status": "running",
+    "endpoints": {
+        "health": "/health",
+        "stats": "/stats"
+    }
+}).encode("utf-8")
+
+
+# State-change actions that Discord tends to emit in quick bursts (role
+# shuffles, mute toggles); within one batch only their net change is kept
+COALESCED_ACTION_TYPES = frozenset({
+    ActionType.MEMBER_UPDATE,
+    ActionType.VOICE_STATE_UPDATE,
+    ActionType.WEBHOOK_UPDATE,
+})
+
+
+def _merge_optional(
+    base: Optional[Dict[str, Any]],
+    override: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Merge two optional dicts, with override winning; None if both are None."""
+    if base is None and override is None:
+        return None
+    return {**(base or {}), **(override or {})}
+
+
+def coalesce_update_actions(actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge repeated update actions on the same target.
+    
+    Update actions sharing a type, guild, channel and target (or user) are
+    folded into one, holding the earliest before-state and the latest
+    after-state. Voice state updates that move the user between channels are
+    never merged. Other actions are kept as they are. Merged actions stay at
+    the position of their first occurrence.
+    
+    Args:
+        actions: Queued actions, oldest first
+    
+    Returns:
+        Actions with repeated updates merged
+    """
+    merged: Dict[Any, Dict[str, Any]] = {}
+    for index, action in enumerate(actions):
+        key: Any = index
+        if action["action_type"] in COALESCED_ACTION_TYPES:
+            key = (
+                action["action_type"],
+                action["guild_id"],
+                action["channel_id"],
+                action["target_id"] or action["user_id"],
+            )
+        
+        if action["action_type"] == ActionType.VOICE_STATE_UPDATE:
+            # Joins, moves and leaves are kept as they are; only changes
+            # within one voice channel (mute, deafen) are merged, per channel
+            voice_channel = (action["before_data"] or {}).get("channel_id")
+            if voice_channel != (action["after_data"] or {}).get("channel_id"):
+                key = index
+            else:
+                key = (*key, voice_channel)
+        
+        earlier = merged.get(key)
+        if earlier is None:
+            merged[key] = action
+            continue
+        
+        # Per-field changes ({"before": ..., "after": ...}) keep their
+        # earliest before value
+        action_data = _merge_optional(earlier["action_data"], action["action_data"])
+        for field, change in (earlier["action_data"] or {}).items():
+            later = action_data[field]
+            if isinstance(change, dict) and "before" in change and isinstance(later, dict):
+                action_data[field] = {**later, "before": change["before"]}
+        
+        merged[key] = {
+            **action,
+            "before_data": _merge_optional(action["before_data"], earlier["before_data"]),
+            "after_data": _merge_optional(earlier["after_data"], action["after_data"]),
+            "action_data": action_data,
+        }
+    
+    return list(merged.values())
+
+
+class BoundedIdSet:
+    """
+    Set of Discord IDs that forgets the oldest entries past a fixed capacity.
+    
+    Membership checks stay O(1) while memory stays bounded, so a long-running
+    bot does not accumulate every ID it has ever seen.
+    """
+    
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize an empty set.
+        
+        Args:
+            capacity: Maximum number of IDs to remember
+        """
+        self.capacity = capacity
+        # Insertion-ordered so both evicting the oldest ID and forgetting an
+        # arbitrary one are O(1)
+        self._ids: "OrderedDict[int, None]" = OrderedDict()
+    
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._ids
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def add(self, item_id: int) -> None:
+        """
+        Remember an ID, evicting the oldest one if the set is full.
+        
+        Args:
+            item_id: Discord snowflake ID
+        """
+        if item_id in self._ids:
+            return
+        
+        if len(self._ids) >= self.capacity:
+            self._ids.popitem(last=False)
+        
+        self._ids[item_id] = None
+    
+    def discard(self, item_id: int) -> None:
+        """
+        Forget an ID if it is present.
+        
+        Args:
+            item_id: Discord snowflake ID
+        """
+        self._ids.pop(item_id, None)
+
+
 class DiscordLogger(commands.Bot):
     """
     Discord bot for comprehensive message and action logging.
@@ -55,25 +215,46 @@ class DiscordLogger(commands.Bot):
         # Initialize components
         self.db_manager = SupabaseManager(self.config)
         
-        # Queues for batch processing
-        self.message_queue: deque = deque(maxlen=self.config.max_queue_size)
-        self.action_queue: deque = deque(maxlen=self.config.max_queue_size)
+        # Queues for batch processing, each drained by a consumer task
+        self.message_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.max_queue_size)
+        self.action_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.max_queue_size)
+        # Queue size from which /health reports a queue as full
+        self._queue_full_threshold = int(self.config.max_queue_size * 0.9)
+        self._consumer_tasks: List[asyncio.Task] = []
         
-        # Tracking sets for processed items with size limits
-        self.processed_messages: Set[str] = set()
-        self.processed_actions: Set[str] = set()
+        # Recently queued message IDs, to skip duplicate deliveries
         self._max_tracked_items = 100000  # Maximum items to track
-        self._cleanup_threshold = 50000   # Clean up to this many items
+        self.processed_messages = BoundedIdSet(self._max_tracked_items)
+        
+        # Guild/channel filter decisions by raw ID; the filters don't change
+        # while the bot runs, so each ID only goes through the config once
+        self._guild_filter_cache: Dict[int, bool] = {}
+        self._channel_filter_cache: Dict[int, bool] = {}
         
         # Backfill tracking
-        self.backfill_in_progress: Dict[str, bool] = {}
+        self.backfill_in_progress: Set[int] = set()
         self.backfill_tasks: Dict[str, asyncio.Task] = {}
+        # Fire-and-forget tasks, referenced here so they can't be garbage
+        # collected while still running
+        self._background_tasks: Set[asyncio.Task] = set()
+        # Guild backfill slots: a counter under a condition so the limit can be
+        # changed at runtime (see set_backfill_concurrency)
+        self._backfill_slots = asyncio.Condition()
+        self._backfill_active = 0
+        self._backfill_limit = self.config.backfill_guild_concurrency
         
-        # Statistics
+        # Statistics; uptime is measured on the monotonic clock so it is
+        # cheap to read and unaffected by wall clock adjustments
+        self._started_monotonic = time.monotonic()
+        # RSS changes slowly, so it is sampled on every memory_sample_every-th
+        # update_stats run from a Process handle created once
+        self._process = psutil.Process(os.getpid()) if psutil is not None else None
+        self._stats_ticks = 0
         self.stats = {
             "messages_processed": 0,
             "actions_processed": 0,
             "errors": 0,
+            "items_dropped": 0,
             "start_time": datetime.now(timezone.utc),
             "uptime_seconds": 0,
             "memory_usage_mb": 0,
@@ -86,6 +267,11 @@ class DiscordLogger(commands.Bot):
         # Health check server
         self.health_app = None
         self.health_server = None
+        # Serialized /stats response, refreshed by update_stats
+        self._stats_body = b"{}"
+        # Last health status and when it was computed, on the monotonic clock;
+        # reused for health_cache_ttl seconds so probes don't each hit the database
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         
         # Setup logging
         self._setup_logging()
@@ -93,8 +279,40 @@ class DiscordLogger(commands.Bot):
         # Register event handlers
         self._register_event_handlers()
         
+        # Shutdown task started by a signal, kept so it isn't garbage collected
+        self._shutdown_task: Optional[asyncio.Task] = None
+    
+    async def setup_hook(self) -> None:
+        """
+        Run async setup once the event loop is running, before connecting.
+        
+        Runs once per start, unlike on_ready, which fires again after every
+        reconnect. A database that can't be initialized stops the bot here,
+        before it joins the gateway.
+        """
         # Setup signal handlers for graceful shutdown
         self._setup_signal_handlers()
+        
+        # Initialize database
+        try:
+            await self.db_manager.initialize()
+            logger.info("Database initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize database: {e}")
+            raise
+        
+        # Start background tasks
+        self._consumer_tasks = [
+            asyncio.create_task(self._batch_consumer(self.message_queue, self._process_message_batch)),
+            asyncio.create_task(self._batch_consumer(self.action_queue, self._process_action_batch)),
+        ]
+        if self.config.force_gc_on_cleanup:
+            self.cleanup_memory.start()
+        self.update_stats.start()
+        
+        # Start health check server
+        if self.config.health_check_enabled:
+            await self._start_health_server()
     
     def _setup_logging(self) -> None:
         """Setup logging configuration."""
@@ -103,12 +321,18 @@ class DiscordLogger(commands.Bot):
         # Remove default logger
         logger.remove()
         
-        # Add console logger
+        # Sinks are enqueued so writes (and log file compression) happen on
+        # loguru's worker thread instead of blocking the event loop
+        
+        # Add console logger; colors only on a terminal, since container
+        # platforms capture stderr through a pipe and just store the codes
+        colorize = sys.stderr.isatty()
         logger.add(
             sys.stderr,
             level=log_level,
-            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-            colorize=True
+            format=CONSOLE_LOG_FORMAT if colorize else PLAIN_LOG_FORMAT,
+            colorize=colorize,
+            enqueue=True
         )
         
         # Add file logger if configured
@@ -116,10 +340,11 @@ class DiscordLogger(commands.Bot):
             logger.add(
                 self.config.log_file_path,
                 level=log_level,
-                format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+                format=PLAIN_LOG_FORMAT,
                 rotation=self.config.log_max_size,
                 retention=self.config.log_backup_count,
-                compression="gz"
+                compression="gz",
+                enqueue=True
             )
     
     def _register_event_handlers(self) -> None:
@@ -131,40 +356,26 @@ class DiscordLogger(commands.Bot):
             logger.info(f"Bot logged in as {self.user} (ID: {self.user.id})")
             logger.info(f"Connected to {len(self.guilds)} guilds")
             
-            # Initialize database
-            try:
-                await self.db_manager.initialize()
-                logger.info("Database initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize database: {e}")
-                await self.close()
-                return
-            
-            # Start background tasks
-            self.process_queues.start()
-            self.cleanup_memory.start()
-            self.update_stats.start()
-            
-            # Start health check server
-            if self.config.health_check_enabled:
-                await self._start_health_server()
-            
             # Store guild and channel information
             await self._store_guild_info()
             
             # Start backfill if enabled
             if self.config.backfill_enabled and self.config.backfill_on_startup:
                 logger.info("Starting backfill process...")
-                asyncio.create_task(self._start_backfill_all_guilds())
+                self._spawn(self._start_backfill_all_guilds())
         
         @self.event
         async def on_message(message: discord.Message) -> None:
             """Handle new messages."""
-            if not await self._should_process_message(message):
+            # Skip if message ID already processed
+            if message.id in self.processed_messages:
+                return
+            
+            if not self._should_process_message(message):
                 return
             
             # Add to processing queue
-            await self._queue_message(message)
+            self._queue_message(message)
             
             # Process bot commands
             await self.process_commands(message)
@@ -172,40 +383,40 @@ class DiscordLogger(commands.Bot):
         @self.event
         async def on_message_edit(before: discord.Message, after: discord.Message) -> None:
             """Handle message edits."""
-            if not await self._should_process_message(after):
+            if not self._should_process_message(after):
                 return
             
             # Store the edited message
-            await self._queue_message(after)
+            self._queue_message(after)
             
             # Store edit action
-            await self._queue_action(
+            self._queue_action(
                 ActionType.MESSAGE_EDIT,
-                guild_id=str(after.guild.id) if after.guild else None,
-                channel_id=str(after.channel.id),
-                user_id=str(after.author.id),
-                target_id=str(after.id),
-                before_data={"content": before.content, "edited_at": before.edited_at.isoformat() if before.edited_at else None},
-                after_data={"content": after.content, "edited_at": after.edited_at.isoformat() if after.edited_at else None}
+                guild_id=after.guild.id if after.guild else None,
+                channel_id=after.channel.id,
+                user_id=after.author.id,
+                target_id=after.id,
+                before_data={"content": before.content, "edited_at": before.edited_at},
+                after_data={"content": after.content, "edited_at": after.edited_at}
             )
         
         @self.event
         async def on_message_delete(message: discord.Message) -> None:
             """Handle message deletions."""
-            if not await self._should_process_message(message):
+            if not self._should_process_message(message):
                 return
             
             # Store delete action
-            await self._queue_action(
+            self._queue_action(
                 ActionType.MESSAGE_DELETE,
-                guild_id=str(message.guild.id) if message.guild else None,
-                channel_id=str(message.channel.id),
-                user_id=str(message.author.id),
-                target_id=str(message.id),
+                guild_id=message.guild.id if message.guild else None,
+                channel_id=message.channel.id,
+                user_id=message.author.id,
+                target_id=message.id,
                 before_data={
                     "content": message.content,
                     "author_id": str(message.author.id),
-                    "created_at": message.created_at.isoformat()
+                    "created_at": message.created_at
                 }
             )
         
@@ -216,52 +427,66 @@ class DiscordLogger(commands.Bot):
                 return
             
             # Filter messages we should process
-            filtered_messages = []
-            for message in messages:
-                if await self._should_process_message(message):
-                    filtered_messages.append(message)
+            filtered_messages = [message for message in messages if self._should_process_message(message)]
             
             if not filtered_messages:
                 return
             
             # Store bulk delete action
-            await self._queue_action(
+            self._queue_action(
                 ActionType.MESSAGE_BULK_DELETE,
-                guild_id=str(filtered_messages[0].guild.id) if filtered_messages[0].guild else None,
-                channel_id=str(filtered_messages[0].channel.id),
+                guild_id=filtered_messages[0].guild.id if filtered_messages[0].guild else None,
+                channel_id=filtered_messages[0].channel.id,
                 action_data={
                     "message_count": len(filtered_messages),
                     "message_ids": [str(msg.id) for msg in filtered_messages]
                 }
             )
+            
+            # Also record each message like a single delete, so its content
+            # is kept; the action consumer stores them in batches
+            for message in filtered_messages:
+                self._queue_action(
+                    ActionType.MESSAGE_DELETE,
+                    guild_id=message.guild.id if message.guild else None,
+                    channel_id=message.channel.id,
+                    user_id=message.author.id,
+                    target_id=message.id,
+                    action_data={"bulk": True},
+                    before_data={
+                        "content": message.content,
+                        "author_id": str(message.author.id),
+                        "created_at": message.created_at
+                    }
+                )
         
         @self.event
         async def on_member_join(member: discord.Member) -> None:
             """Handle member joins."""
-            if not self.config.should_process_guild(str(member.guild.id)):
+            if not self._should_process_guild(member.guild.id):
                 return
             
-            await self._queue_action(
+            self._queue_action(
                 ActionType.MEMBER_JOIN,
-                guild_id=str(member.guild.id),
-                user_id=str(member.id),
+                guild_id=member.guild.id,
+                user_id=member.id,
                 action_data={
                     "username": member.name,
                     "display_name": member.display_name,
-                    "joined_at": member.joined_at.isoformat() if member.joined_at else None
+                    "joined_at": member.joined_at
                 }
             )
         
         @self.event
         async def on_member_remove(member: discord.Member) -> None:
             """Handle member leaves."""
-            if not self.config.should_process_guild(str(member.guild.id)):
+            if not self._should_process_guild(member.guild.id):
                 return
             
-            await self._queue_action(
+            self._queue_action(
                 ActionType.MEMBER_LEAVE,
-                guild_id=str(member.guild.id),
-                user_id=str(member.id),
+                guild_id=member.guild.id,
+                user_id=member.id,
                 action_data={
                     "username": member.name,
                     "display_name": member.display_name,
@@ -278,12 +503,11 @@ class DiscordLogger(commands.Bot):
             await self.db_manager.store_guild_info(guild)
             
             # Store channel information
-            for channel in guild.channels:
-                await self.db_manager.store_channel_info(channel)
+            await self.db_manager.store_channels_batch(guild.channels)
             
             # Start backfill for new guild if enabled
             if self.config.backfill_enabled:
-                asyncio.create_task(self._start_backfill_guild(guild))
+                self._schedule_guild_backfill(guild)
         
         @self.event
         async def on_guild_remove(guild: discord.Guild) -> None:
@@ -294,6 +518,11 @@ class DiscordLogger(commands.Bot):
             if str(guild.id) in self.backfill_tasks:
                 self.backfill_tasks[str(guild.id)].cancel()
                 del self.backfill_tasks[str(guild.id)]
+            
+            # Forget the guild's cached filter decisions
+            self._guild_filter_cache.pop(guild.id, None)
+            for channel in guild.channels:
+                self._channel_filter_cache.pop(channel.id, None)
         
         @self.event
         async def on_error(event: str, *args, **kwargs) -> None:
@@ -304,10 +533,10 @@ class DiscordLogger(commands.Bot):
         @self.event
         async def on_voice_state_update(member: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> None:
             """Handle voice state updates."""
-            await self._queue_action(
+            self._queue_action(
                 ActionType.VOICE_STATE_UPDATE,
-                guild_id=str(member.guild.id),
-                user_id=str(member.id),
+                guild_id=member.guild.id,
+                user_id=member.id,
                 before_data={
                     "channel_id": str(before.channel.id) if before.channel else None,
                     "mute": before.mute,
@@ -327,16 +556,16 @@ class DiscordLogger(commands.Bot):
         @self.event
         async def on_guild_channel_create(channel: discord.abc.GuildChannel) -> None:
             """Handle channel creation."""
-            await self._queue_action(
+            self._queue_action(
                 ActionType.CHANNEL_CREATE,
-                guild_id=str(channel.guild.id),
-                target_id=str(channel.id),
+                guild_id=channel.guild.id,
+                target_id=channel.id,
                 target_type="channel",
                 target_name=channel.name,
                 after_data={
                     "channel_type": str(channel.type),
                     "position": getattr(channel, 'position', None),
-                    "category_id": str(channel.category.id) if getattr(channel, 'category', None) else None
+                    "category_id": str(channel.category_id) if getattr(channel, 'category_id', None) else None
                 }
             )
             
@@ -346,16 +575,18 @@ class DiscordLogger(commands.Bot):
         @self.event
         async def on_guild_channel_delete(channel: discord.abc.GuildChannel) -> None:
             """Handle channel deletion."""
-            await self._queue_action(
+            self._channel_filter_cache.pop(channel.id, None)
+            
+            self._queue_action(
                 ActionType.CHANNEL_DELETE,
-                guild_id=str(channel.guild.id),
-                target_id=str(channel.id),
+                guild_id=channel.guild.id,
+                target_id=channel.id,
                 target_type="channel",
                 target_name=channel.name,
                 before_data={
                     "channel_type": str(channel.type),
                     "position": getattr(channel, 'position', None),
-                    "category_id": str(channel.category.id) if getattr(channel, 'category', None) else None
+                    "category_id": str(channel.category_id) if getattr(channel, 'category_id', None) else None
                 }
             )
         
@@ -367,16 +598,21 @@ class DiscordLogger(commands.Bot):
             if before.nick != after.nick:
                 changes["nickname"] = {"before": before.nick, "after": after.nick}
             
-            if before.roles != after.roles:
-                before_roles = [str(role.id) for role in before.roles]
-                after_roles = [str(role.id) for role in after.roles]
-                changes["roles"] = {"before": before_roles, "after": after_roles}
+            # Member.roles builds a sorted list of Role objects on every
+            # access, so read it once per side and compare plain ints
+            before_role_ids = [role.id for role in before.roles]
+            after_role_ids = [role.id for role in after.roles]
+            if before_role_ids != after_role_ids:
+                changes["roles"] = {
+                    "before": [str(role_id) for role_id in before_role_ids],
+                    "after": [str(role_id) for role_id in after_role_ids]
+                }
             
             if changes:
-                await self._queue_action(
+                self._queue_action(
                     ActionType.MEMBER_UPDATE,
-                    guild_id=str(after.guild.id),
-                    user_id=str(after.id),
+                    guild_id=after.guild.id,
+                    user_id=after.id,
                     before_data=changes.get("before", {}),
                     after_data=changes.get("after", {}),
                     action_data=changes
@@ -385,16 +621,16 @@ class DiscordLogger(commands.Bot):
         @self.event
         async def on_webhooks_update(channel: discord.abc.GuildChannel) -> None:
             """Handle webhook updates (create, update, delete)."""
-            if not self.config.should_process_guild(str(channel.guild.id)):
+            if not self._should_process_guild(channel.guild.id):
                 return
             
-            if not self.config.should_process_channel(str(channel.id)):
+            if not self._should_process_channel(channel.id):
                 return
             
-            await self._queue_action(
+            self._queue_action(
                 ActionType.WEBHOOK_UPDATE,
-                guild_id=str(channel.guild.id),
-                channel_id=str(channel.id),
+                guild_id=channel.guild.id,
+                channel_id=channel.id,
                 target_type="channel",
                 target_name=channel.name,
                 action_data={
@@ -404,15 +640,62 @@ class DiscordLogger(commands.Bot):
             )
     
     def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
+        """
+        Setup signal handlers for graceful shutdown.
+        
+        Must be called from the running event loop. Handlers are registered
+        with the loop where supported; on Windows, which lacks
+        add_signal_handler, a plain signal handler hands off to the loop.
+        """
+        loop = asyncio.get_running_loop()
+        
+        def request_shutdown(signum: int) -> None:
             logger.info(f"Received signal {signum}, shutting down gracefully...")
-            asyncio.create_task(self.close())
+            if self._shutdown_task is None:
+                self._shutdown_task = loop.create_task(self.close())
+        
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, request_shutdown, signum)
+            except NotImplementedError:
+                signal.signal(
+                    signum,
+                    lambda received, frame: loop.call_soon_threadsafe(request_shutdown, received)
+                )
+    
+    def _should_process_guild(self, guild_id: int) -> bool:
+        """
+        Check the guild filters, caching the decision per guild.
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        Args:
+            guild_id: Discord guild ID
+        
+        Returns:
+            True if the guild should be processed, False otherwise
+        """
+        allowed = self._guild_filter_cache.get(guild_id)
+        if allowed is None:
+            allowed = self.config.should_process_guild(str(guild_id))
+            self._guild_filter_cache[guild_id] = allowed
+        return allowed
     
-    async def _should_process_message(self, message: discord.Message) -> bool:
+    def _should_process_channel(self, channel_id: int) -> bool:
+        """
+        Check the channel filters, caching the decision per channel.
+        
+        Args:
+            channel_id: Discord channel ID
+        
+        Returns:
+            True if the channel should be processed, False otherwise
+        """
+        allowed = self._channel_filter_cache.get(channel_id)
+        if allowed is None:
+            allowed = self.config.should_process_channel(str(channel_id))
+            self._channel_filter_cache[channel_id] = allowed
+        return allowed
+    
+    def _should_process_message(self, message: discord.Message) -> bool:
         """
         Check if a message should be processed.
         
@@ -426,10 +709,6 @@ class DiscordLogger(commands.Bot):
         if not message:
             return False
         
-        # Skip if message ID already processed
-        if str(message.id) in self.processed_messages:
-            return False
-        
         # Check if we should process bot messages
         if message.author.bot and not self.config.process_bot_messages:
             return False
@@ -443,36 +722,36 @@ class DiscordLogger(commands.Bot):
             return False
         
         # Check guild filtering
-        if message.guild and not self.config.should_process_guild(str(message.guild.id)):
+        if message.guild and not self._should_process_guild(message.guild.id):
             return False
         
         # Check channel filtering
-        if not self.config.should_process_channel(str(message.channel.id)):
+        if not self._should_process_channel(message.channel.id):
             return False
         
         return True
     
-    async def _queue_message(self, message: discord.Message) -> None:
+    def _queue_message(self, message: discord.Message) -> None:
         """
         Add a message to the processing queue.
         
         Args:
             message: Discord message to queue
         """
-        self.message_queue.append(message)
-        self.processed_messages.add(str(message.id))
-        
-        # Process immediately if queue is full
-        if len(self.message_queue) >= self.config.batch_size:
-            await self._process_message_queue()
+        self.processed_messages.add(message.id)
+        evicted = self._enqueue(self.message_queue, message)
+        # A message dropped to make room was never stored, so it must not be
+        # skipped as already processed if it is seen again
+        if evicted is not None:
+            self.processed_messages.discard(evicted.id)
     
-    async def _queue_action(
+    def _queue_action(
         self,
         action_type: ActionType,
-        guild_id: Optional[str] = None,
-        channel_id: Optional[str] = None,
-        user_id: Optional[str] = None,
-        target_id: Optional[str] = None,
+        guild_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        target_id: Optional[int] = None,
         action_data: Optional[Dict[str, Any]] = None,
         before_data: Optional[Dict[str, Any]] = None,
         after_data: Optional[Dict[str, Any]] = None
@@ -498,102 +777,245 @@ class DiscordLogger(commands.Bot):
             "target_id": target_id,
             "action_data": action_data,
             "before_data": before_data,
-            "after_data": after_data
+            "after_data": after_data,
+            "occurred_at": datetime.now(timezone.utc)
         }
         
-        self.action_queue.append(action)
-        
-        # Process immediately if queue is full
-        if len(self.action_queue) >= self.config.batch_size:
-            await self._process_action_queue()
+        self._enqueue(self.action_queue, action)
     
-    @tasks.loop(seconds=30)
-    async def process_queues(self) -> None:
-        """Process message and action queues periodically."""
-        try:
-            await self._process_message_queue()
-            await self._process_action_queue()
-        except Exception as e:
-            logger.error(f"Error processing queues: {e}")
-            self.stats["errors"] += 1
+    def _enqueue(self, queue: asyncio.Queue, item: Any) -> Optional[Any]:
+        """
+        Put an item on a processing queue without waiting.
+        
+        Items are stamped with their enqueue time so the consumer can bound
+        how long they wait. When the queue is full the oldest item is dropped,
+        so event handlers never block on database writes.
+        
+        Args:
+            queue: Message or action queue
+            item: Item to queue
+        
+        Returns:
+            The item dropped to make room, or None if nothing was dropped
+        """
+        evicted = None
+        if queue.full():
+            evicted = queue.get_nowait()[1]
+            self.stats["items_dropped"] += 1
+            # Drops come in floods once a queue saturates; items_dropped has
+            # the exact count, so only the first and every Nth one is logged
+            dropped = self.stats["items_dropped"]
+            if dropped == 1 or dropped % DROP_WARNING_EVERY == 0:
+                logger.warning("Processing queue full, dropped oldest item ({} dropped so far)", dropped)
+        queue.put_nowait((time.monotonic(), item))
+        return evicted
     
-    async def _process_message_queue(self) -> None:
-        """Process all messages in the queue."""
-        if not self.message_queue:
-            return
+    async def _batch_consumer(
+        self,
+        queue: asyncio.Queue,
+        process_batch: Callable[[List[Any]], Awaitable[None]]
+    ) -> None:
+        """
+        Drain a queue in batches for the lifetime of the bot.
         
-        # Get messages from queue
-        messages = []
-        while self.message_queue and len(messages) < self.config.batch_size:
-            messages.append(self.message_queue.popleft())
+        A batch is flushed once it reaches batch_size items or once its oldest
+        item has been queued for flush_interval seconds, whichever comes
+        first. The age is measured from enqueue time, so time spent waiting
+        behind a previous flush counts against it. With flush_interval set to
+        0 a batch is whatever queued up during the previous flush, so batches
+        grow and shrink with database throughput.
         
-        if not messages:
-            return
+        Args:
+            queue: Queue to drain
+            process_batch: Coroutine function storing one batch
+        """
+        while True:
+            batch = []
+            try:
+                opened_at, item = await queue.get()
+                batch.append(item)
+                deadline = opened_at + self.config.flush_interval
+                
+                while len(batch) < self.config.batch_size:
+                    try:
+                        batch.append(queue.get_nowait()[1])
+                        continue
+                    except asyncio.QueueEmpty:
+                        pass
+                    
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append((await asyncio.wait_for(queue.get(), remaining))[1])
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Shutting down: store what was already taken off the queue
+                if batch:
+                    await process_batch(batch)
+                raise
+            
+            # Shielded so a shutdown mid-flush lets the write finish instead of
+            # losing the batch and closing the database client underneath it
+            flush = asyncio.ensure_future(process_batch(batch))
+            try:
+                await asyncio.shield(flush)
+            except asyncio.CancelledError:
+                await asyncio.gather(flush, return_exceptions=True)
+                raise
+            except Exception as e:
+                logger.error(f"Error processing queued batch: {e}")
+                self.stats["errors"] += 1
+    
+    async def _drain_queue(
+        self,
+        queue: asyncio.Queue,
+        process_batch: Callable[[List[Any]], Awaitable[None]]
+    ) -> None:
+        """
+        Process everything left on a queue, e.g. at shutdown.
         
+        Args:
+            queue: Queue to drain
+            process_batch: Coroutine function storing one batch
+        """
+        while not queue.empty():
+            count = min(self.config.batch_size, queue.qsize())
+            await process_batch([queue.get_nowait()[1] for _ in range(count)])
+    
+    async def _process_message_batch(self, messages: List[discord.Message]) -> None:
+        """
+        Store a batch of queued messages.
+        
+        Args:
+            messages: Messages taken from the queue
+        """
         try:
             # Store messages in batch
             stored_count = await self.db_manager.store_messages_batch(messages)
             self.stats["messages_processed"] += stored_count
+            if not stored_count:
+                return
             
-            # Update checkpoints
+            # Only the newest message per channel moves its checkpoint, so
+            # write one checkpoint per channel, all in a single upsert
+            latest: Dict[int, discord.Message] = {}
             for message in messages:
-                await self.db_manager.update_checkpoint(
-                    "message",
-                    last_processed_id=str(message.id),
-                    last_processed_timestamp=message.created_at,
-                    guild_id=str(message.guild.id) if message.guild else None,
-                    channel_id=str(message.channel.id)
-                )
+                current = latest.get(message.channel.id)
+                if current is None or message.id > current.id:
+                    latest[message.channel.id] = message
             
-            logger.debug(f"Processed {stored_count} messages from queue")
+            await self.db_manager.update_message_checkpoints(list(latest.values()))
+            
+            logger.debug("Processed {} messages from queue", stored_count)
             
         except Exception as e:
             logger.error(f"Failed to process message queue: {e}")
             self.stats["errors"] += 1
     
-    async def _process_action_queue(self) -> None:
-        """Process all actions in the queue."""
-        if not self.action_queue:
+    async def _process_action_batch(self, actions: List[Dict[str, Any]]) -> None:
+        """
+        Store a batch of queued actions.
+        
+        Args:
+            actions: Actions taken from the queue
+        """
+        if self.config.coalesce_update_actions:
+            actions = coalesce_update_actions(actions)
+        
+        try:
+            actions_processed = await self.db_manager.store_actions_batch(actions)
+        except NonRetryableError:
+            # Handled below by storing actions one by one
+            pass
+        else:
+            # Either stored, or the database is unreachable; retrying row by
+            # row would only multiply requests against it
+            self.stats["errors"] += len(actions) - actions_processed
+            if actions_processed:
+                self.stats["actions_processed"] += actions_processed
+                logger.debug("Processed {} actions from queue", actions_processed)
             return
         
-        # Process actions one by one (they're smaller than messages)
-        actions_processed = 0
-        while self.action_queue:
-            action = self.action_queue.popleft()
-            
-            try:
-                success = await self.db_manager.store_action(**action)
-                if success:
-                    actions_processed += 1
-                    
-            except Exception as e:
-                logger.error(f"Failed to store action: {e}")
-                self.stats["errors"] += 1
+        # The database rejected the batch, so store actions individually to
+        # isolate the bad rows. Actions on the same target are stored in
+        # order; unrelated ones are written concurrently, up to
+        # action_concurrency at a time
+        by_target: Dict[Any, List[Dict[str, Any]]] = {}
+        for index, action in enumerate(actions):
+            # Untargeted actions each get their own group; tupled so an index
+            # can never collide with an integer snowflake
+            key = action["target_id"] if action["target_id"] is not None else ("untargeted", index)
+            by_target.setdefault(key, []).append(action)
+        
+        slots = asyncio.Semaphore(self.config.action_concurrency)
+        
+        async def store_in_order(target_actions: List[Dict[str, Any]]) -> int:
+            stored = 0
+            async with slots:
+                for action in target_actions:
+                    # store_action logs and returns False on failure
+                    if await self.db_manager.store_action(**action):
+                        stored += 1
+            return stored
+        
+        results = await asyncio.gather(*(store_in_order(group) for group in by_target.values()))
+        actions_processed = sum(results)
+        self.stats["errors"] += len(actions) - actions_processed
         
         if actions_processed > 0:
             self.stats["actions_processed"] += actions_processed
-            logger.debug(f"Processed {actions_processed} actions from queue")
+            logger.debug("Processed {} actions from queue", actions_processed)
     
     async def _store_guild_info(self) -> None:
         """Store information about all guilds and channels."""
-        for guild in self.guilds:
-            try:
-                # Store guild info
-                await self.db_manager.store_guild_info(guild)
-                
-                # Store channel info
-                for channel in guild.channels:
-                    await self.db_manager.store_channel_info(channel)
-                    
-            except Exception as e:
-                logger.error(f"Failed to store info for guild {guild.name}: {e}")
+        guilds = list(self.guilds)
+        try:
+            # Bulk upserts across all guilds, chunked by batch_size
+            await self.db_manager.store_guilds_batch(guilds)
+            await self.db_manager.store_channels_batch(
+                [channel for guild in guilds for channel in guild.channels]
+            )
+        
+        except Exception as e:
+            logger.error(f"Failed to store guild info: {e}")
     
     async def _start_backfill_all_guilds(self) -> None:
         """Start backfill process for all guilds."""
         for guild in self.guilds:
-            if self.config.should_process_guild(str(guild.id)):
-                task = asyncio.create_task(self._start_backfill_guild(guild))
-                self.backfill_tasks[str(guild.id)] = task
+            if self._should_process_guild(guild.id):
+                self._schedule_guild_backfill(guild)
+    
+    def _spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """
+        Start a background task and keep a reference until it finishes.
+        
+        Args:
+            coro: Coroutine to run
+        
+        Returns:
+            The started task
+        """
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    def _schedule_guild_backfill(self, guild: discord.Guild) -> None:
+        """
+        Start a guild's backfill task unless one is already running.
+        
+        Args:
+            guild: Discord guild to backfill
+        """
+        guild_id = str(guild.id)
+        existing = self.backfill_tasks.get(guild_id)
+        if existing is not None and not existing.done():
+            logger.debug("Backfill task already scheduled for guild {}", guild.name)
+            return
+        
+        self.backfill_tasks[guild_id] = self._spawn(self._start_backfill_guild(guild))
     
     async def _start_backfill_guild(self, guild: discord.Guild) -> None:
         """
@@ -604,51 +1026,106 @@ class DiscordLogger(commands.Bot):
         """
         guild_id = str(guild.id)
         
-        if guild_id in self.backfill_in_progress and self.backfill_in_progress[guild_id]:
+        if guild.id in self.backfill_in_progress:
             logger.warning(f"Backfill already in progress for guild {guild.name}")
             return
         
-        self.backfill_in_progress[guild_id] = True
+        self.backfill_in_progress.add(guild.id)
         
         try:
-            # Mark backfill as starting
-            await self.db_manager.update_checkpoint(
-                "backfill",
-                guild_id=guild_id,
-                backfill_in_progress=True
-            )
-            
-            logger.info(f"Starting backfill for guild {guild.name} ({guild_id})")
-            
-            # Backfill each channel
-            for channel in guild.text_channels:
-                if self.config.should_process_channel(str(channel.id)):
-                    await self._backfill_channel(channel)
-            
-            # Mark backfill as completed
-            await self.db_manager.update_checkpoint(
-                "backfill",
-                guild_id=guild_id,
-                backfill_in_progress=False,
-                last_processed_timestamp=datetime.now(timezone.utc)
-            )
-            
-            logger.info(f"Completed backfill for guild {guild.name}")
+            # Bound the number of guilds paging Discord history at once
+            async with self._backfill_slot():
+                # Mark backfill as starting
+                await self.db_manager.update_checkpoint(
+                    "backfill",
+                    guild_id=guild_id,
+                    backfill_in_progress=True
+                )
+                
+                logger.info(f"Starting backfill for guild {guild.name} ({guild_id})")
+                
+                # Fetch every channel's resume point in one request
+                last_message_ids = await self.db_manager.get_last_message_ids(guild_id)
+                
+                # Backfill channels concurrently; each channel pages its own
+                # history, bounded by backfill_channel_concurrency
+                channel_slots = asyncio.Semaphore(self.config.backfill_channel_concurrency)
+                
+                async def backfill_in_slot(channel: discord.TextChannel) -> None:
+                    async with channel_slots:
+                        await self._backfill_channel(channel, last_message_ids)
+                
+                await asyncio.gather(
+                    *(
+                        backfill_in_slot(channel)
+                        for channel in guild.text_channels
+                        if self._should_process_channel(channel.id)
+                    ),
+                    return_exceptions=True
+                )
+                
+                # Mark backfill as completed
+                await self.db_manager.update_checkpoint(
+                    "backfill",
+                    guild_id=guild_id,
+                    backfill_in_progress=False,
+                    last_processed_timestamp=datetime.now(timezone.utc)
+                )
+                
+                logger.info(f"Completed backfill for guild {guild.name}")
             
         except Exception as e:
             logger.error(f"Backfill failed for guild {guild.name}: {e}")
             
         finally:
-            self.backfill_in_progress[guild_id] = False
+            self.backfill_in_progress.discard(guild.id)
             if guild_id in self.backfill_tasks:
                 del self.backfill_tasks[guild_id]
     
-    async def _backfill_channel(self, channel: discord.TextChannel) -> None:
+    @asynccontextmanager
+    async def _backfill_slot(self) -> AsyncIterator[None]:
+        """Hold one guild backfill slot, waiting until one is free."""
+        async with self._backfill_slots:
+            await self._backfill_slots.wait_for(lambda: self._backfill_active < self._backfill_limit)
+            self._backfill_active += 1
+        
+        try:
+            yield
+        finally:
+            async with self._backfill_slots:
+                self._backfill_active -= 1
+                self._backfill_slots.notify(1)
+    
+    async def set_backfill_concurrency(self, limit: int) -> None:
+        """
+        Change how many guilds may be backfilled at once.
+        
+        Lowering the limit lets running backfills finish and holds new ones
+        until the active count drops below it; raising it wakes waiters.
+        
+        Args:
+            limit: New maximum number of concurrent guild backfills (1-32)
+        """
+        if limit < 1 or limit > 32:
+            raise ValueError("Backfill guild concurrency must be between 1 and 32")
+        
+        async with self._backfill_slots:
+            self._backfill_limit = limit
+            self._backfill_slots.notify_all()
+        
+        logger.info(f"Backfill guild concurrency set to {limit}")
+    
+    async def _backfill_channel(
+        self, 
+        channel: discord.TextChannel, 
+        last_message_ids: Optional[Dict[str, Optional[str]]] = None
+    ) -> None:
         """
         Backfill messages from a specific channel.
         
         Args:
             channel: Discord text channel to backfill
+            last_message_ids: Prefetched resume points for the channel's guild
         """
         channel_id = str(channel.id)
         guild_id = str(channel.guild.id) if channel.guild else None
@@ -656,66 +1133,140 @@ class DiscordLogger(commands.Bot):
         logger.info(f"Starting backfill for channel #{channel.name} ({channel_id})")
         
         try:
-            # Get the last processed message ID from database
-            last_message_id = await self.db_manager.get_last_message_id(channel_id, guild_id)
+            # Get the last processed message ID, querying only if it wasn't prefetched
+            if last_message_ids is not None and channel_id in last_message_ids:
+                last_message_id = last_message_ids[channel_id]
+            else:
+                last_message_id = await self.db_manager.get_last_message_id(channel_id, guild_id)
             
             # Determine cutoff date for backfill
             cutoff_date = None
             if self.config.backfill_max_age_days:
                 cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.config.backfill_max_age_days)
             
-            # Backfill messages
+            # Backfill messages in chunks of backfill_chunk_size
             total_processed = 0
+            chunk: List[discord.Message] = []
+            
+            # Each full chunk is stored in the background while the next one
+            # is fetched, so Discord and database latency overlap; at most
+            # one store is in flight per channel
+            in_flight: Optional[Tuple[asyncio.Task, discord.Message]] = None
+            
+            # Checkpoints are written behind the stored chunks, at most once
+            # per backfill_checkpoint_interval, plus once at the end
+            unrecorded: Optional[discord.Message] = None
+            last_checkpoint_at = time.monotonic()
+            
+            async def collect_in_flight() -> None:
+                nonlocal in_flight, total_processed, unrecorded
+                if in_flight is None:
+                    return
+                task, newest = in_flight
+                in_flight = None
+                stored = await task
+                if stored:
+                    total_processed += stored
+                    unrecorded = newest
+            
+            # Start after the last processed message or the cutoff, whichever
+            # is later; history() pages by snowflake, so neither older
+            # messages nor already stored ones are fetched at all
+            after_id = int(last_message_id) if last_message_id else 0
+            if cutoff_date:
+                after_id = max(after_id, discord.utils.time_snowflake(cutoff_date))
+            after = discord.Object(id=after_id) if after_id else None
             
-            # Start from the last processed message or from the beginning
-            after = discord.Object(id=int(last_message_id)) if last_message_id else None
-            
-            async for message in channel.history(
-                limit=None,
-                after=after,
-                oldest_first=True
-            ):
-                # Check cutoff date
-                if cutoff_date and message.created_at < cutoff_date:
-                    continue
-                
-                # Skip if we've already processed this message
-                if str(message.id) in self.processed_messages:
-                    continue
-                
-                # Check if we should process this message
-                if not await self._should_process_message(message):
-                    continue
+            try:
+                async for message in channel.history(
+                    limit=None,
+                    after=after,
+                    oldest_first=True
+                ):
+                    # Check if we should process this message
+                    if not self._should_process_message(message):
+                        continue
+                    
+                    chunk.append(message)
+                    if len(chunk) < self.config.backfill_chunk_size:
+                        continue
+                    
+                    await collect_in_flight()
+                    in_flight = (
+                        asyncio.create_task(self._store_backfill_chunk(chunk, channel_id)),
+                        chunk[-1]
+                    )
+                    chunk = []
+                    
+                    if unrecorded and time.monotonic() - last_checkpoint_at >= self.config.backfill_checkpoint_interval:
+                        await self._update_backfill_checkpoint(unrecorded, guild_id, channel_id, total_processed)
+                        unrecorded = None
+                        last_checkpoint_at = time.monotonic()
+                    
+                    # Delay to avoid rate limiting
+                    await asyncio.sleep(self.config.backfill_delay_seconds)
                 
-                # Store message as backfilled
-                try:
-                    success = await self.db_manager.store_message(message, is_backfilled=True)
-                    if success:
-                        total_processed += 1
-                        self.processed_messages.add(str(message.id))
-                        
-                        # Update checkpoint periodically
-                        if total_processed % self.config.backfill_chunk_size == 0:
-                            await self.db_manager.update_checkpoint(
-                                "backfill",
-                                last_processed_id=str(message.id),
-                                last_processed_timestamp=message.created_at,
-                                guild_id=guild_id,
-                                channel_id=channel_id,
-                                total_processed=total_processed
-                            )
-                            
-                            # Delay to avoid rate limiting
-                            await asyncio.sleep(self.config.backfill_delay_seconds)
-                            
-                except Exception as e:
-                    logger.error(f"Failed to store backfilled message {message.id}: {e}")
+                await collect_in_flight()
+            finally:
+                # Only set if fetching failed or was cancelled mid-channel
+                if in_flight is not None:
+                    in_flight[0].cancel()
+            
+            if chunk:
+                stored = await self._store_backfill_chunk(chunk, channel_id)
+                if stored:
+                    total_processed += stored
+                    unrecorded = chunk[-1]
+            
+            if unrecorded:
+                await self._update_backfill_checkpoint(unrecorded, guild_id, channel_id, total_processed)
             
             logger.info(f"Backfilled {total_processed} messages from #{channel.name}")
             
         except Exception as e:
             logger.error(f"Error during backfill of channel #{channel.name}: {e}")
     
+    async def _store_backfill_chunk(self, messages: List[discord.Message], channel_id: str) -> int:
+        """
+        Store one chunk of backfilled messages.
+        
+        Args:
+            messages: Messages in history order
+            channel_id: Channel being backfilled
+        
+        Returns:
+            Number of messages stored
+        """
+        stored = await self.db_manager.store_messages_batch(messages, is_backfilled=True)
+        if not stored:
+            logger.error(f"Failed to store {len(messages)} backfilled messages for channel {channel_id}")
+        return stored
+    
+    async def _update_backfill_checkpoint(
+        self,
+        message: discord.Message,
+        guild_id: Optional[str],
+        channel_id: str,
+        total_processed: int
+    ) -> None:
+        """
+        Record a channel's backfill progress.
+        
+        Args:
+            message: Newest stored message
+            guild_id: Guild ID of the channel
+            channel_id: Channel being backfilled
+            total_processed: Messages stored for the channel so far
+        """
+        await self.db_manager.update_checkpoint(
+            "backfill",
+            last_processed_id=str(message.id),
+            last_processed_timestamp=message.created_at,
+            guild_id=guild_id,
+            channel_id=channel_id,
+            total_processed=total_processed
+        )
+    
     async def _start_health_server(self) -> None:
         """Start the health check server."""
         try:
@@ -724,30 +1275,26 @@ class DiscordLogger(commands.Bot):
             async def health_handler(request):
                 """Health check endpoint handler."""
                 health_data = await self.get_health_status()
-                return web.json_response(health_data)
+                # stats carries start_time as a datetime
+                return web.json_response(health_data, dumps=partial(json.dumps, default=str))
             
             async def stats_handler(request):
                 """Statistics endpoint handler."""
-                stats_data = await self.get_stats()
-                return web.json_response(stats_data)
+                return web.Response(body=self._stats_body, content_type="application/json")
             
             async def root_handler(request):
                 """Root endpoint handler."""
-                return web.json_response({
-                    "name": "Discord Logger Bot",
-                    "status": "running",
-                    "endpoints": {
-                        "health": "/health",
-                        "stats": "/stats"
-                    }
-                })
+                return web.Response(body=ROOT_RESPONSE_BODY, content_type="application/json")
             
             self.health_app.router.add_get('/', root_handler)
             self.health_app.router.add_get('/health', health_handler)
             self.health_app.router.add_get('/stats', stats_handler)
             
+            await self._refresh_stats_body()
+            
             runner = web.AppRunner(self.health_app)
             await runner.setup()
+            self.health_server = runner
             
             # Use Railway's PORT environment variable or fallback to config
             port = int(os.environ.get('PORT', self.config.health_check_port))
@@ -761,24 +1308,19 @@ class DiscordLogger(commands.Bot):
     
     @tasks.loop(minutes=10)
     async def cleanup_memory(self) -> None:
-        """Clean up memory periodically."""
+        """
+        Force a full garbage collection periodically.
+        
+        Only started when force_gc_on_cleanup is set: a full collection walks
+        every tracked object, discord.py's caches included, and stalls the
+        event loop meanwhile, while the generational collector already runs
+        on its own as objects are allocated.
+        """
         try:
-            # Clean up tracked message/action sets if they get too large
-            if len(self.processed_messages) > self._max_tracked_items:
-                # Keep only the most recent items (approximate)
-                messages_list = list(self.processed_messages)
-                self.processed_messages = set(messages_list[-self._cleanup_threshold:])
-                logger.info(f"Cleaned up processed messages tracking: {len(messages_list)} -> {len(self.processed_messages)}")
-            
-            if len(self.processed_actions) > self._max_tracked_items:
-                actions_list = list(self.processed_actions)
-                self.processed_actions = set(actions_list[-self._cleanup_threshold:])
-                logger.info(f"Cleaned up processed actions tracking: {len(actions_list)} -> {len(self.processed_actions)}")
-            
             # Force garbage collection
             collected = gc.collect()
             if collected > 0:
-                logger.debug(f"Garbage collector freed {collected} objects")
+                logger.debug("Garbage collector freed {} objects", collected)
                 
         except Exception as e:
             logger.error(f"Error during memory cleanup: {e}")
@@ -787,31 +1329,47 @@ class DiscordLogger(commands.Bot):
     async def update_stats(self) -> None:
         """Update bot statistics."""
         try:
-            import psutil
-            import os
-            
             # Update runtime stats
-            uptime = (datetime.now(timezone.utc) - self.stats["start_time"]).total_seconds()
-            self.stats["uptime_seconds"] = uptime
+            self.stats["uptime_seconds"] = time.monotonic() - self._started_monotonic
             
-            # Update memory usage
-            process = psutil.Process(os.getpid())
-            memory_mb = process.memory_info().rss / 1024 / 1024
-            self.stats["memory_usage_mb"] = round(memory_mb, 2)
+            # Update memory usage; skipped if psutil is not installed
+            if self._process is not None and self._stats_ticks % self.config.memory_sample_every == 0:
+                memory_mb = self._process.memory_info().rss / 1024 / 1024
+                self.stats["memory_usage_mb"] = round(memory_mb, 2)
+            self._stats_ticks += 1
             
             # Update queue sizes
-            self.stats["queue_sizes"]["messages"] = len(self.message_queue)
-            self.stats["queue_sizes"]["actions"] = len(self.action_queue)
+            self.stats["queue_sizes"]["messages"] = self.message_queue.qsize()
+            self.stats["queue_sizes"]["actions"] = self.action_queue.qsize()
             
-        except ImportError:
-            # psutil not available, skip memory stats
-            uptime = (datetime.now(timezone.utc) - self.stats["start_time"]).total_seconds()
-            self.stats["uptime_seconds"] = uptime
         except Exception as e:
             logger.error(f"Error updating stats: {e}")
+        
+        await self._refresh_stats_body()
+    
+    async def _refresh_stats_body(self) -> None:
+        """
+        Serialize the current stats for the /stats endpoint.
+        
+        The endpoint serves these bytes as they are, so polling it costs no
+        work on the event loop; they are at most one update_stats interval old.
+        """
+        try:
+            self._stats_body = json.dumps(await self.get_stats()).encode("utf-8")
+        except Exception as e:
+            logger.error(f"Error serializing stats: {e}")
     
     async def get_health_status(self) -> Dict[str, Any]:
-        """Get comprehensive health status."""
+        """
+        Get comprehensive health status.
+        
+        A status computed less than health_cache_ttl seconds ago is returned
+        as is, so several probes polling /health cost one database check.
+        """
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < self.config.health_cache_ttl:
+            return self._health_cache[1]
+        
         try:
             # Database health
             db_health = await self.db_manager.health_check()
@@ -826,10 +1384,10 @@ class DiscordLogger(commands.Bot):
             
             # Queue health
             queue_health = {
-                "message_queue_size": len(self.message_queue),
-                "action_queue_size": len(self.action_queue),
-                "message_queue_full": len(self.message_queue) >= self.config.max_queue_size * 0.9,
-                "action_queue_full": len(self.action_queue) >= self.config.max_queue_size * 0.9,
+                "message_queue_size": self.message_queue.qsize(),
+                "action_queue_size": self.action_queue.qsize(),
+                "message_queue_full": self.message_queue.qsize() >= self._queue_full_threshold,
+                "action_queue_full": self.action_queue.qsize() >= self._queue_full_threshold,
             }
             
             # Overall health status
@@ -840,7 +1398,7 @@ class DiscordLogger(commands.Bot):
                 not queue_health["action_queue_full"]
             )
             
-            return {
+            status = {
                 "healthy": overall_healthy,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "database": db_health,
@@ -848,6 +1406,8 @@ class DiscordLogger(commands.Bot):
                 "queues": queue_health,
                 "stats": self.stats
             }
+            self._health_cache = (now, status)
+            return status
             
         except Exception as e:
             logger.error(f"Error getting health status: {e}")
@@ -864,20 +1424,19 @@ class DiscordLogger(commands.Bot):
         Returns:
             Dictionary containing bot statistics
         """
-        uptime = datetime.now(timezone.utc) - self.stats["start_time"]
-        
         return {
-            "uptime_seconds": uptime.total_seconds(),
+            "uptime_seconds": time.monotonic() - self._started_monotonic,
             "messages_processed": self.stats["messages_processed"],
             "actions_processed": self.stats["actions_processed"],
             "errors": self.stats["errors"],
+            "items_dropped": self.stats["items_dropped"],
             "guilds": len(self.guilds),
             "queue_sizes": {
-                "messages": len(self.message_queue),
-                "actions": len(self.action_queue)
+                "messages": self.message_queue.qsize(),
+                "actions": self.action_queue.qsize()
             },
             "backfill_status": {
-                guild_id: status for guild_id, status in self.backfill_in_progress.items()
+                str(guild_id): True for guild_id in self.backfill_in_progress
             }
         }
     
@@ -887,8 +1446,11 @@ class DiscordLogger(commands.Bot):
         
         try:
             # Stop background tasks
-            if hasattr(self, 'process_queues') and not self.process_queues.is_cancelled():
-                self.process_queues.cancel()
+            for task in self._consumer_tasks:
+                task.cancel()
+            if self._consumer_tasks:
+                await asyncio.gather(*self._consumer_tasks, return_exceptions=True)
+            self._consumer_tasks = []
             
             if hasattr(self, 'cleanup_memory') and not self.cleanup_memory.is_cancelled():
                 self.cleanup_memory.cancel()
@@ -896,23 +1458,24 @@ class DiscordLogger(commands.Bot):
             if hasattr(self, 'update_stats') and not self.update_stats.is_cancelled():
                 self.update_stats.cancel()
             
+            # Cancel any running backfill tasks; they are awaited below,
+            # together with the queue drains
+            backfill_tasks = [task for task in self.backfill_tasks.values() if not task.done()]
+            for task in backfill_tasks:
+                task.cancel()
+            
             # Process remaining items in queues
-            if self.message_queue:
-                logger.info(f"Processing {len(self.message_queue)} remaining messages...")
-                await self._process_message_queue()
-            
-            if self.action_queue:
-                logger.info(f"Processing {len(self.action_queue)} remaining actions...")
-                await self._process_action_queue()
-            
-            # Cancel any running backfill tasks
-            for task in self.backfill_tasks.values():
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
+            if not self.message_queue.empty():
+                logger.info(f"Processing {self.message_queue.qsize()} remaining messages...")
+            if not self.action_queue.empty():
+                logger.info(f"Processing {self.action_queue.qsize()} remaining actions...")
+            
+            await asyncio.gather(
+                self._drain_queue(self.message_queue, self._process_message_batch),
+                self._drain_queue(self.action_queue, self._process_action_batch),
+                *backfill_tasks,
+                return_exceptions=True
+            )
             
             # Close database connection
             if self.db_manager:
@@ -924,27 +1487,10 @@ class DiscordLogger(commands.Bot):
             
             logger.info("Shutdown complete")
             
+            # Wait for the enqueued log sinks to write everything out
+            await logger.complete()
+        
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
         finally:
             await super().close()
-
-
-async def main() -> None:
-    """Main entry point for the bot."""
-    try:
-        config = get_config()
-        bot = DiscordLogger(config)
-        
-        logger.info("Starting Discord Logger Bot...")
-        await bot.start(config.discord_token)
-        
-    except KeyboardInterrupt:
-        logger.info("Received keyboard interrupt, shutting down...")
-    except Exception as e:
-        logger.error(f"Fatal error: {e}")
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
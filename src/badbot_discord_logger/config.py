@@ -6,14 +6,28 @@ and provides validation for required settings.
 """
 
 import os
+import re
 from pathlib import Path
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, FrozenSet, Tuple
 from enum import Enum
+from urllib.parse import urlparse
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict, ValidationError
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator, ConfigDict, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Dotted hostname made of non-empty labels, e.g. "project.supabase.co".
+# Custom domains are allowed, so this does not require supabase.co.
+HOSTNAME_PATTERN = re.compile(r"^[a-z0-9-]+(\.[a-z0-9-]+)+$", re.IGNORECASE)
+
+
+def _parse_id_list(value: Optional[str]) -> List[str]:
+    """Split a comma-separated ID setting into its non-empty entries."""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
 class LogLevel(str, Enum):
     """Valid log levels."""
     
@@ -37,7 +51,8 @@ class Config(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="forbid",
-        validate_assignment=True
+        # Read-only once loaded, so values parsed or cached from it can't go stale
+        frozen=True
     )
     
     # Discord Bot Configuration
@@ -65,8 +80,11 @@ class Config(BaseSettings):
     backfill_enabled: bool = Field(True, description="Enable automatic backfilling")
     backfill_chunk_size: int = Field(100, description="Number of messages to process per chunk during backfill")
     backfill_delay_seconds: float = Field(1.0, description="Delay between backfill chunks in seconds")
+    backfill_checkpoint_interval: float = Field(30.0, description="Minimum seconds between backfill checkpoint writes per channel")
     backfill_max_age_days: Optional[int] = Field(None, description="Maximum age of messages to backfill (None for all)")
     backfill_on_startup: bool = Field(True, description="Run backfill on bot startup")
+    backfill_guild_concurrency: int = Field(4, description="Maximum number of guilds backfilled concurrently")
+    backfill_channel_concurrency: int = Field(4, description="Maximum number of channels backfilled concurrently per guild")
     
     # Rate Limiting Configuration
     rate_limit_enabled: bool = Field(True, description="Enable rate limiting")
@@ -84,18 +102,34 @@ class Config(BaseSettings):
     allowed_channels: Optional[str] = Field(None, description="Comma-separated list of channel IDs to monitor")
     ignored_channels: str = Field("", description="Comma-separated list of channel IDs to ignore")
     
+    # Parsed filters, built once when the config is loaded: the IDs in
+    # configured order, and as sets for lookups
+    _allowed_guilds_ids: Tuple[str, ...] = PrivateAttr(())
+    _ignored_guilds_ids: Tuple[str, ...] = PrivateAttr(())
+    _allowed_channels_ids: Tuple[str, ...] = PrivateAttr(())
+    _ignored_channels_ids: Tuple[str, ...] = PrivateAttr(())
+    _allowed_guilds_set: FrozenSet[str] = PrivateAttr(frozenset())
+    _ignored_guilds_set: FrozenSet[str] = PrivateAttr(frozenset())
+    _allowed_channels_set: FrozenSet[str] = PrivateAttr(frozenset())
+    _ignored_channels_set: FrozenSet[str] = PrivateAttr(frozenset())
+    
     # Performance Configuration
     batch_size: int = Field(50, description="Batch size for database operations")
-    flush_interval: int = Field(30, description="Interval to flush pending operations in seconds")
+    flush_interval: int = Field(30, description="Maximum seconds a queued item waits before its batch is flushed (0 flushes as soon as the database is free)")
     max_queue_size: int = Field(10000, description="Maximum size of message queue")
+    action_concurrency: int = Field(4, description="Maximum number of action writes in flight at once")
+    coalesce_update_actions: bool = Field(True, description="Merge repeated update actions on the same target within a batch")
+    force_gc_on_cleanup: bool = Field(False, description="Force a full garbage collection every 10 minutes")
     
     # Health Check Configuration
     health_check_enabled: bool = Field(True, description="Enable health check endpoint")
     health_check_port: int = Field(8080, description="Port for health check server")
+    health_cache_ttl: float = Field(2.0, description="Seconds a computed health status is reused (0 disables caching)")
     
     # Metrics Configuration
     metrics_enabled: bool = Field(False, description="Enable metrics collection")
     metrics_port: int = Field(9090, description="Port for metrics server")
+    memory_sample_every: int = Field(5, description="Sample process memory on every Nth stats update")
     
     @field_validator("discord_token")
     @classmethod
@@ -109,14 +143,12 @@ class Config(BaseSettings):
     @classmethod
     def validate_supabase_url(cls, v: str) -> str:
         """Validate Supabase URL format."""
-        if not v.startswith("https://"):
+        parsed_url = urlparse(v)
+        if parsed_url.scheme != "https":
             raise ValueError("Supabase URL must use HTTPS")
         
-        # Remove the https:// prefix for domain validation
-        domain = v[8:]  # Remove "https://"
-        
-        # Basic domain validation
-        if not domain or '.' not in domain or domain.endswith('.') or domain.startswith('.'):
+        # Domain validation on the parsed hostname, so ports and paths are accepted
+        if not parsed_url.hostname or not HOSTNAME_PATTERN.match(parsed_url.hostname):
             raise ValueError("Supabase URL must be a valid HTTPS URL with a proper domain")
         
         return v
@@ -137,6 +169,46 @@ class Config(BaseSettings):
             raise ValueError("Backfill chunk size must be between 1 and 1000")
         return v
     
+    @field_validator("backfill_guild_concurrency")
+    @classmethod
+    def validate_backfill_guild_concurrency(cls, v: int) -> int:
+        """Validate backfill guild concurrency."""
+        if v < 1 or v > 32:
+            raise ValueError("Backfill guild concurrency must be between 1 and 32")
+        return v
+    
+    @field_validator("backfill_channel_concurrency")
+    @classmethod
+    def validate_backfill_channel_concurrency(cls, v: int) -> int:
+        """Validate backfill channel concurrency."""
+        if v < 1 or v > 32:
+            raise ValueError("Backfill channel concurrency must be between 1 and 32")
+        return v
+    
+    @field_validator("action_concurrency")
+    @classmethod
+    def validate_action_concurrency(cls, v: int) -> int:
+        """Validate action write concurrency."""
+        if v < 1 or v > 32:
+            raise ValueError("Action concurrency must be between 1 and 32")
+        return v
+    
+    @field_validator("health_cache_ttl")
+    @classmethod
+    def validate_health_cache_ttl(cls, v: float) -> float:
+        """Validate health status cache TTL."""
+        if v < 0:
+            raise ValueError("Health cache TTL cannot be negative")
+        return v
+    
+    @field_validator("memory_sample_every")
+    @classmethod
+    def validate_memory_sample_every(cls, v: int) -> int:
+        """Validate memory sampling interval."""
+        if v < 1:
+            raise ValueError("Memory sample interval must be at least 1")
+        return v
+    
     @field_validator("batch_size")
     @classmethod
     def validate_batch_size(cls, v: int) -> int:
@@ -169,6 +241,19 @@ class Config(BaseSettings):
             raise ValueError("Port must be between 1024 and 65535")
         return v
     
+    @model_validator(mode="after")
+    def parse_filters(self) -> "Config":
+        """Parse the guild and channel filters once, so lookups are set lookups."""
+        self._allowed_guilds_ids = tuple(_parse_id_list(self.allowed_guilds))
+        self._ignored_guilds_ids = tuple(_parse_id_list(self.ignored_guilds))
+        self._allowed_channels_ids = tuple(_parse_id_list(self.allowed_channels))
+        self._ignored_channels_ids = tuple(_parse_id_list(self.ignored_channels))
+        self._allowed_guilds_set = frozenset(self._allowed_guilds_ids)
+        self._ignored_guilds_set = frozenset(self._ignored_guilds_ids)
+        self._allowed_channels_set = frozenset(self._allowed_channels_ids)
+        self._ignored_channels_set = frozenset(self._ignored_channels_ids)
+        return self
+    
     @property
     def is_production(self) -> bool:
         """Check if running in production mode."""
@@ -177,46 +262,34 @@ class Config(BaseSettings):
     @property
     def allowed_guilds_list(self) -> List[str]:
         """Get allowed guilds as a list."""
-        if not self.allowed_guilds:
-            return []
-        return [item.strip() for item in self.allowed_guilds.split(",") if item.strip()]
+        return list(self._allowed_guilds_ids)
     
     @property
     def ignored_guilds_list(self) -> List[str]:
         """Get ignored guilds as a list."""
-        if not self.ignored_guilds:
-            return []
-        return [item.strip() for item in self.ignored_guilds.split(",") if item.strip()]
+        return list(self._ignored_guilds_ids)
     
     @property
     def allowed_channels_list(self) -> List[str]:
         """Get allowed channels as a list."""
-        if not self.allowed_channels:
-            return []
-        return [item.strip() for item in self.allowed_channels.split(",") if item.strip()]
+        return list(self._allowed_channels_ids)
     
     @property
     def ignored_channels_list(self) -> List[str]:
         """Get ignored channels as a list."""
-        if not self.ignored_channels:
-            return []
-        return [item.strip() for item in self.ignored_channels.split(",") if item.strip()]
+        return list(self._ignored_channels_ids)
     
     def should_process_guild(self, guild_id: str) -> bool:
         """Check if a guild should be processed."""
-        if guild_id in self.ignored_guilds_list:
+        if guild_id in self._ignored_guilds_set:
             return False
-        if not self.allowed_guilds_list:
-            return True
-        return guild_id in self.allowed_guilds_list
+        return not self._allowed_guilds_set or guild_id in self._allowed_guilds_set
     
     def should_process_channel(self, channel_id: str) -> bool:
         """Check if a channel should be processed."""
-        if channel_id in self.ignored_channels_list:
+        if channel_id in self._ignored_channels_set:
             return False
-        if not self.allowed_channels_list:
-            return True
-        return channel_id in self.allowed_channels_list
+        return not self._allowed_channels_set or channel_id in self._allowed_channels_set
     
     def get_database_table_names(self) -> dict[str, str]:
         """Get database table names for different data types."""
@@ -226,6 +299,7 @@ class Config(BaseSettings):
             "checkpoints": "discord_checkpoints",
             "guilds": "discord_guilds",
             "channels": "discord_channels",
+            "channel_last_message": "discord_channel_last_message",
         }
     
     def validate_required_permissions(self) -> List[str]:
@@ -7,6 +7,7 @@ and retry logic.
 """
 
 import asyncio
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional, Union, Tuple, Callable
@@ -15,10 +16,20 @@ from functools import lru_cache
 import json
 
 import discord
+import httpx
 from supabase import create_client, Client
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from supabase.lib.client_options import ClientOptions
+from postgrest.types import ReturnMethod
+from postgrest.utils import SyncClient
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_random, retry_if_exception_type
 import asyncpg
 
+try:
+    # Optional faster JSON encoder for request bodies
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from loguru import logger
 except ImportError:
@@ -34,6 +45,41 @@ from .models import (
 )
 
 
+# Substrings of error messages that indicate a transient failure worth retrying,
+# including Supabase/PostgREST rate limiting
+RETRYABLE_ERROR_KEYWORDS = (
+    "connection", "timeout", "network", "503", "502", "500",
+    "429", "too many requests", "rate limit"
+)
+
+
+# Top-level ID fields of a queued action; the bot keeps them as int snowflakes
+# and they are stringified only when building the database row
+ACTION_ID_FIELDS = ("guild_id", "channel_id", "user_id", "target_id")
+
+
+def _id_str(value: Optional[Union[int, str]]) -> Optional[str]:
+    """Return a Discord ID as the string the database stores, keeping None."""
+    return str(value) if value is not None else None
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time as a second-precision ISO 8601 string."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+
+class _OrjsonClient(SyncClient):
+    """PostgREST HTTP client that encodes JSON request bodies with orjson."""
+    
+    def build_request(self, method: str, url: Any, *, json: Any = None, **kwargs: Any) -> httpx.Request:
+        if json is not None:
+            headers = httpx.Headers(kwargs.get("headers"))
+            headers["Content-Type"] = "application/json"
+            kwargs["headers"] = headers
+            kwargs["content"] = orjson.dumps(json)
+        return super().build_request(method, url, **kwargs)
+
+
 class DatabaseError(Exception):
     """Custom exception for database operations."""
     pass
@@ -71,6 +117,9 @@ class SupabaseManager:
         """
         self.config = config
         self.client: Optional[Client] = None
+        # Pooled HTTP client installed on the PostgREST client; owned and
+        # closed here, since supabase may replace the PostgREST client
+        self._http_session: Optional[SyncClient] = None
         self.table_names = config.get_database_table_names()
         self._connection_lock = asyncio.Lock()
         self._initialized = False
@@ -87,8 +136,10 @@ class SupabaseManager:
             try:
                 self.client = create_client(
                     self.config.supabase_url,
-                    self.config.supabase_key
+                    self.config.supabase_key,
+                    options=ClientOptions(postgrest_client_timeout=self.config.connection_timeout)
                 )
+                self._configure_http_pool(self.client)
                 
                 # Test connection by attempting to read from a table
                 await self._test_connection()
@@ -99,6 +150,35 @@ class SupabaseManager:
                 logger.error(f"Failed to initialize Supabase client: {e}")
                 raise ConnectionError(f"Database initialization failed: {e}") from e
     
+    def _configure_http_pool(self, client: Client) -> None:
+        """
+        Give the PostgREST client a pooled session that keeps connections alive.
+        
+        httpx's default keep-alive expiry is 5 seconds, shorter than the flush
+        interval, so idle connections were dropped between flushes and every
+        flush paid for a fresh TCP and TLS handshake.
+        
+        Args:
+            client: Supabase client whose PostgREST session should be replaced
+        """
+        postgrest = client.postgrest
+        session = postgrest.session
+        # PostgREST expects its session to be a SyncClient; row payloads are
+        # encoded with orjson when it is installed
+        client_class = _OrjsonClient if orjson is not None else SyncClient
+        self._http_session = client_class(
+            base_url=session.base_url,
+            headers=session.headers,
+            timeout=self.config.connection_timeout,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=20,
+                keepalive_expiry=max(60.0, self.config.flush_interval * 2)
+            )
+        )
+        postgrest.session = self._http_session
+        session.close()
+    
     def _ensure_client(self) -> Client:
         """Ensure client is initialized and return it."""
         if not self.client:
@@ -116,7 +196,8 @@ class SupabaseManager:
             client = self._ensure_client()
             
             # Try to query the checkpoints table (should exist)
-            result = client.table(self.table_names["checkpoints"]).select("*").limit(1).execute()
+            query = client.table(self.table_names["checkpoints"]).select("checkpoint_id").limit(1)
+            result = await asyncio.to_thread(query.execute)
             logger.debug("Database connection test successful")
         except Exception as e:
             logger.error(f"Database connection test failed: {e}")
@@ -128,7 +209,8 @@ class SupabaseManager:
     
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
+        # Jitter keeps concurrent writers from retrying in lockstep after a 429
+        wait=wait_exponential(multiplier=1, min=4, max=10) + wait_random(0, 2),
         retry=retry_if_exception_type(RetryableError)
     )
     async def _execute_with_retry(
@@ -158,13 +240,15 @@ class SupabaseManager:
                 await self.initialize()
                 
             client = self._ensure_client()
-            logger.debug(f"Executing {operation_name}")
+            logger.debug("Executing {}", operation_name)
             result = operation(client, *args, **kwargs)
             
+            # supabase-py is synchronous; run the HTTP request in a worker
+            # thread so it doesn't block the Discord gateway/event loop
             if hasattr(result, 'execute'):
-                result = result.execute()
+                result = await asyncio.to_thread(result.execute)
                 
-            logger.debug(f"Successfully executed {operation_name}")
+            logger.debug("Successfully executed {}", operation_name)
             return result
             
         except Exception as e:
@@ -172,7 +256,7 @@ class SupabaseManager:
             
             # Determine if this is a retryable error
             error_str = str(e).lower()
-            if any(keyword in error_str for keyword in ["connection", "timeout", "network", "503", "502", "500"]):
+            if any(keyword in error_str for keyword in RETRYABLE_ERROR_KEYWORDS):
                 raise RetryableError(f"Retryable error in {operation_name}: {e}") from e
             else:
                 raise NonRetryableError(f"Non-retryable error in {operation_name}: {e}") from e
@@ -192,20 +276,11 @@ class SupabaseManager:
             message_model = self._convert_discord_message(message, is_backfilled)
             message_dict = self._message_model_to_dict(message_model)
             
-            # Debug: Check if the dict is JSON serializable
-            try:
-                import json
-                json.dumps(message_dict)
-                logger.debug(f"Message dict is JSON serializable for message {message.id}")
-            except Exception as json_error:
-                logger.error(f"Message dict is NOT JSON serializable for message {message.id}: {json_error}")
-                logger.error(f"Problematic fields: {[(k, type(v)) for k, v in message_dict.items() if not isinstance(v, (str, int, float, bool, type(None), list, dict))]}")
-                raise
-            
             def operation(client: Client) -> Any:
                 return client.table(self.table_names["messages"]).upsert(
                     message_dict,
-                    on_conflict="message_id"
+                    on_conflict="message_id",
+                    returning=ReturnMethod.minimal
                 )
             
             await self._execute_with_retry(
@@ -213,7 +288,7 @@ class SupabaseManager:
                 f"store_message_{message.id}"
             )
             
-            logger.debug(f"Stored message {message.id} from {message.author}")
+            logger.debug("Stored message {} from {}", message.id, message.author)
             return True
             
         except NonRetryableError as e:
@@ -242,10 +317,13 @@ class SupabaseManager:
             return 0
         
         try:
+            # One timestamp for the whole batch instead of one per model
+            logged_at = datetime.now(timezone.utc)
             message_dicts = []
-            for msg in messages:
+            # Snowflake order is creation order, so rows land in index order
+            for msg in sorted(messages, key=lambda m: m.id):
                 try:
-                    model = self._convert_discord_message(msg, is_backfilled)
+                    model = self._convert_discord_message(msg, is_backfilled, logged_at)
                     message_dict = self._message_model_to_dict(model)
                     message_dicts.append(message_dict)
                 except Exception as e:
@@ -258,7 +336,8 @@ class SupabaseManager:
             def operation(client: Client) -> Any:
                 return client.table(self.table_names["messages"]).upsert(
                     message_dicts,
-                    on_conflict="message_id"
+                    on_conflict="message_id",
+                    returning=ReturnMethod.minimal
                 )
             
             await self._execute_with_retry(
@@ -276,18 +355,19 @@ class SupabaseManager:
     async def store_action(
         self, 
         action_type: ActionType, 
-        guild_id: Optional[str] = None,
-        channel_id: Optional[str] = None,
-        user_id: Optional[str] = None,
+        guild_id: Optional[Union[int, str]] = None,
+        channel_id: Optional[Union[int, str]] = None,
+        user_id: Optional[Union[int, str]] = None,
         username: Optional[str] = None,
         display_name: Optional[str] = None,
-        target_id: Optional[str] = None,
+        target_id: Optional[Union[int, str]] = None,
         target_type: Optional[str] = None,
         target_name: Optional[str] = None,
         action_data: Optional[Dict[str, Any]] = None,
         before_data: Optional[Dict[str, Any]] = None,
         after_data: Optional[Dict[str, Any]] = None,
-        is_backfilled: bool = False
+        is_backfilled: bool = False,
+        occurred_at: Optional[datetime] = None
     ) -> bool:
         """
         Store a Discord action/event in the database.
@@ -306,6 +386,7 @@ class SupabaseManager:
             before_data: State before the action
             after_data: State after the action
             is_backfilled: Whether this action is from backfill operation
+            occurred_at: When the action happened, defaults to now
             
         Returns:
             True if successful, False otherwise
@@ -314,18 +395,18 @@ class SupabaseManager:
             action_model = ActionModel(
                 action_id=str(uuid.uuid4()),
                 action_type=action_type,
-                guild_id=guild_id,
-                channel_id=channel_id,
-                user_id=user_id,
+                guild_id=_id_str(guild_id),
+                channel_id=_id_str(channel_id),
+                user_id=_id_str(user_id),
                 username=username,
                 display_name=display_name,
-                target_id=target_id,
+                target_id=_id_str(target_id),
                 target_type=target_type,
                 target_name=target_name,
                 action_data=action_data or {},
                 before_data=before_data,
                 after_data=after_data,
-                occurred_at=datetime.now(timezone.utc),
+                occurred_at=occurred_at or datetime.now(timezone.utc),
                 is_backfilled=is_backfilled
             )
             
@@ -333,7 +414,8 @@ class SupabaseManager:
             
             def operation(client: Client) -> Any:
                 return client.table(self.table_names["actions"]).insert(
-                    action_dict
+                    action_dict,
+                    returning=ReturnMethod.minimal
                 )
             
             await self._execute_with_retry(
@@ -341,13 +423,79 @@ class SupabaseManager:
                 f"store_action_{action_type.value}"
             )
             
-            logger.debug(f"Stored action {action_type.value} for guild {guild_id}")
+            logger.debug("Stored action {} for guild {}", action_type.value, guild_id)
             return True
             
         except Exception as e:
             logger.error(f"Failed to store action {action_type.value}: {e}")
             return False
     
+    async def store_actions_batch(
+        self,
+        actions: List[Dict[str, Any]],
+        is_backfilled: bool = False
+    ) -> int:
+        """
+        Store multiple actions in a single insert.
+        
+        Args:
+            actions: Action fields as accepted by store_action, one dict per action
+            is_backfilled: Whether these actions are from backfill operation
+        
+        Returns:
+            Number of successfully stored actions
+        
+        Raises:
+            NonRetryableError: If the database rejects the batch, so the caller
+                can fall back to storing actions one by one
+        """
+        if not actions:
+            return 0
+        
+        try:
+            now = datetime.now(timezone.utc)
+            action_dicts = []
+            for action in actions:
+                try:
+                    model = ActionModel(
+                        **{
+                            **action,
+                            **{field: _id_str(action.get(field)) for field in ACTION_ID_FIELDS},
+                            "action_id": str(uuid.uuid4()),
+                            "action_data": action.get("action_data") or {},
+                            "occurred_at": action.get("occurred_at") or now,
+                            "is_backfilled": is_backfilled,
+                        }
+                    )
+                    action_dicts.append(self._action_model_to_dict(model))
+                except Exception as e:
+                    logger.warning(f"Failed to convert action {action.get('action_type')}: {e}")
+                    continue
+            
+            if not action_dicts:
+                return 0
+            
+            def operation(client: Client) -> Any:
+                return client.table(self.table_names["actions"]).insert(
+                    action_dicts,
+                    returning=ReturnMethod.minimal
+                )
+            
+            await self._execute_with_retry(
+                operation,
+                f"store_actions_batch_{len(action_dicts)}"
+            )
+            
+            logger.debug("Stored batch of {} actions", len(action_dicts))
+            return len(action_dicts)
+        
+        except NonRetryableError as e:
+            logger.warning(f"Action batch rejected: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to store action batch: {e}")
+            return 0
+    
     async def get_checkpoint(
         self, 
         checkpoint_type: str, 
@@ -427,15 +575,17 @@ class SupabaseManager:
         """
         try:
             # Generate checkpoint ID
-            checkpoint_id = f"{checkpoint_type}_{guild_id or 'global'}_{channel_id or 'all'}"
+            checkpoint_id = self._checkpoint_id(checkpoint_type, guild_id, channel_id)
             
             # Check if checkpoint exists
             existing = await self.get_checkpoint(checkpoint_type, guild_id, channel_id)
             
             if existing:
                 # Update existing checkpoint
+                # The updated_at trigger overwrites this with NOW(); the client
+                # value is only a fallback, so second precision is plenty
                 update_data: Dict[str, Union[str, int, bool]] = {
-                    "updated_at": datetime.now(timezone.utc).isoformat()
+                    "updated_at": _utc_now_iso()
                 }
                 
                 if last_processed_id is not None:
@@ -448,7 +598,10 @@ class SupabaseManager:
                     update_data["backfill_in_progress"] = backfill_in_progress
                 
                 def operation(client: Client) -> Any:
-                    query = client.table(self.table_names["checkpoints"]).update(update_data)
+                    query = client.table(self.table_names["checkpoints"]).update(
+                        update_data,
+                        returning=ReturnMethod.minimal
+                    )
                     return query.eq("checkpoint_id", existing.checkpoint_id)
                 
             else:
@@ -470,7 +623,8 @@ class SupabaseManager:
                 def operation(client: Client) -> Any:
                     return client.table(self.table_names["checkpoints"]).upsert(
                         checkpoint_dict,
-                        on_conflict="checkpoint_id"
+                        on_conflict="checkpoint_id",
+                        returning=ReturnMethod.minimal
                     )
             
             await self._execute_with_retry(
@@ -478,13 +632,69 @@ class SupabaseManager:
                 f"update_checkpoint_{checkpoint_type}"
             )
             
-            logger.debug(f"Updated checkpoint {checkpoint_type} for guild {guild_id}")
+            logger.debug("Updated checkpoint {} for guild {}", checkpoint_type, guild_id)
             return True
             
         except Exception as e:
             logger.error(f"Failed to update checkpoint {checkpoint_type}: {e}")
             return False
     
+    async def update_message_checkpoints(self, messages: List[discord.Message]) -> bool:
+        """
+        Advance the message checkpoints of several channels in one upsert.
+        
+        Only the checkpoint position columns are sent, so existing rows keep
+        their other values and new rows take the table defaults.
+        
+        Args:
+            messages: Newest stored message of each channel, one per channel
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if not messages:
+            return True
+        
+        try:
+            updated_at = _utc_now_iso()
+            rows = []
+            for message in messages:
+                guild_id = str(message.guild.id) if message.guild else None
+                channel_id = str(message.channel.id)
+                rows.append({
+                    "checkpoint_id": self._checkpoint_id("message", guild_id, channel_id),
+                    "checkpoint_type": "message",
+                    "guild_id": guild_id,
+                    "channel_id": channel_id,
+                    "last_processed_id": str(message.id),
+                    "last_processed_timestamp": message.created_at.isoformat(),
+                    "updated_at": updated_at
+                })
+            
+            def operation(client: Client) -> Any:
+                return client.table(self.table_names["checkpoints"]).upsert(
+                    rows,
+                    on_conflict="checkpoint_id",
+                    returning=ReturnMethod.minimal
+                )
+            
+            await self._execute_with_retry(
+                operation,
+                f"update_message_checkpoints_{len(rows)}"
+            )
+            
+            logger.debug("Updated {} message checkpoints", len(rows))
+            return True
+        
+        except Exception as e:
+            logger.error(f"Failed to update message checkpoints: {e}")
+            return False
+    
+    @staticmethod
+    def _checkpoint_id(checkpoint_type: str, guild_id: Optional[str], channel_id: Optional[str]) -> str:
+        """Build the unique checkpoint ID for a type, guild and channel."""
+        return f"{checkpoint_type}_{guild_id or 'global'}_{channel_id or 'all'}"
+    
     async def get_last_message_id(
         self, 
         channel_id: str, 
@@ -495,20 +705,23 @@ class SupabaseManager:
         
         Args:
             channel_id: Channel ID to check
-            guild_id: Guild ID for the channel
+            guild_id: Guild ID for the channel (unused, channel IDs are
+                globally unique)
             
         Returns:
             Message ID if found, None otherwise
         """
         try:
             def operation(client: Client) -> Any:
-                query = client.table(self.table_names["messages"]).select("message_id")
-                query = query.eq("channel_id", channel_id)
-                
-                if guild_id:
-                    query = query.eq("guild_id", guild_id)
-                
-                return query.order("created_at", desc=True).limit(1)
+                # Filtering on channel_id alone lets Postgres answer this from
+                # idx_discord_messages_channel_created without touching the heap
+                return (
+                    client.table(self.table_names["messages"])
+                    .select("message_id")
+                    .eq("channel_id", channel_id)
+                    .order("created_at", desc=True)
+                    .limit(1)
+                )
             
             result = await self._execute_with_retry(
                 operation,
@@ -523,6 +736,40 @@ class SupabaseManager:
             logger.error(f"Failed to get last message ID for channel {channel_id}: {e}")
             return None
     
+    async def get_last_message_ids(self, guild_id: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Get the last processed message ID for every known channel in a guild.
+        
+        Reads the discord_channel_last_message view, so a guild's resume
+        points cost one request instead of one per channel.
+        
+        Args:
+            guild_id: Guild ID to look up
+        
+        Returns:
+            Mapping of channel ID to message ID (None for channels with no
+            stored messages), or None if the lookup failed. Channels missing
+            from discord_channels are absent from the mapping.
+        """
+        try:
+            def operation(client: Client) -> Any:
+                return (
+                    client.table(self.table_names["channel_last_message"])
+                    .select("channel_id,message_id")
+                    .eq("guild_id", guild_id)
+                )
+            
+            result = await self._execute_with_retry(
+                operation,
+                f"get_last_message_ids_{guild_id}"
+            )
+            
+            return {row["channel_id"]: row["message_id"] for row in result.data}
+        
+        except Exception as e:
+            logger.warning(f"Failed to get last message IDs for guild {guild_id}: {e}")
+            return None
+    
     async def store_guild_info(self, guild: discord.Guild) -> bool:
         """
         Store or update guild information.
@@ -534,23 +781,14 @@ class SupabaseManager:
             True if successful, False otherwise
         """
         try:
-            guild_model = GuildInfoModel(
-                guild_id=str(guild.id),
-                name=guild.name,
-                description=guild.description,
-                owner_id=str(guild.owner_id) if guild.owner_id else "0",
-                member_count=guild.member_count or 0,
-                created_at=guild.created_at,
-                icon_url=str(guild.icon.url) if guild.icon else None,
-                banner_url=str(guild.banner.url) if guild.banner else None
-            )
-            
+            guild_model = self._convert_discord_guild(guild)
             guild_dict = self._guild_info_model_to_dict(guild_model)
             
             def operation(client: Client) -> Any:
                 return client.table(self.table_names["guilds"]).upsert(
                     guild_dict,
-                    on_conflict="guild_id"
+                    on_conflict="guild_id",
+                    returning=ReturnMethod.minimal
                 )
             
             await self._execute_with_retry(
@@ -558,13 +796,61 @@ class SupabaseManager:
                 f"store_guild_info_{guild.id}"
             )
             
-            logger.debug(f"Stored guild info for {guild.name} ({guild.id})")
+            logger.debug("Stored guild info for {} ({})", guild.name, guild.id)
             return True
             
         except Exception as e:
             logger.error(f"Failed to store guild info for {guild.id}: {e}")
             return False
     
+    async def store_guilds_batch(self, guilds: List[discord.Guild]) -> int:
+        """
+        Store or update information for multiple guilds using bulk upserts.
+        
+        Guilds are written in chunks of ``batch_size`` rows, so startup costs
+        a handful of requests instead of one per guild.
+        
+        Args:
+            guilds: Discord guild objects to store
+        
+        Returns:
+            Number of successfully stored guilds
+        """
+        guild_dicts = []
+        for guild in guilds:
+            try:
+                guild_dicts.append(self._guild_info_model_to_dict(self._convert_discord_guild(guild)))
+            except Exception as e:
+                logger.warning(f"Failed to convert guild {guild.id}: {e}")
+                continue
+        
+        stored_count = 0
+        chunk_size = self.config.batch_size
+        
+        for start in range(0, len(guild_dicts), chunk_size):
+            chunk = guild_dicts[start:start + chunk_size]
+            
+            try:
+                await self._execute_with_retry(
+                    self._upsert_guilds,
+                    f"store_guilds_batch_{len(chunk)}",
+                    chunk
+                )
+                stored_count += len(chunk)
+            except Exception as e:
+                logger.error(f"Failed to store guild batch of {len(chunk)}: {e}")
+        
+        logger.debug("Stored batch of {} guilds", stored_count)
+        return stored_count
+    
+    def _upsert_guilds(self, client: Client, guild_dicts: List[Dict[str, Any]]) -> Any:
+        """Build a bulk upsert request for guild rows."""
+        return client.table(self.table_names["guilds"]).upsert(
+            guild_dicts,
+            on_conflict="guild_id",
+            returning=ReturnMethod.minimal
+        )
+    
     async def store_channel_info(self, channel: discord.abc.GuildChannel) -> bool:
         """
         Store or update channel information.
@@ -576,22 +862,14 @@ class SupabaseManager:
             True if successful, False otherwise
         """
         try:
-            channel_model = ChannelInfoModel(
-                channel_id=str(channel.id),
-                guild_id=str(channel.guild.id) if hasattr(channel, 'guild') and channel.guild else None,
-                name=channel.name,
-                channel_type=str(channel.type),
-                topic=getattr(channel, 'topic', None),
-                position=getattr(channel, 'position', None),
-                category_id=str(channel.category.id) if getattr(channel, 'category', None) and channel.category else None
-            )
-            
+            channel_model = self._convert_discord_channel(channel)
             channel_dict = self._channel_info_model_to_dict(channel_model)
             
             def operation(client: Client) -> Any:
                 return client.table(self.table_names["channels"]).upsert(
                     channel_dict,
-                    on_conflict="channel_id"
+                    on_conflict="channel_id",
+                    returning=ReturnMethod.minimal
                 )
             
             await self._execute_with_retry(
@@ -599,20 +877,128 @@ class SupabaseManager:
                 f"store_channel_info_{channel.id}"
             )
             
-            logger.debug(f"Stored channel info for {channel.name} ({channel.id})")
+            logger.debug("Stored channel info for {} ({})", channel.name, channel.id)
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to store channel info for {channel.id}: {e}")
             return False
     
-    def _convert_discord_message(self, message: discord.Message, is_backfilled: bool = False) -> MessageModel:
+    async def store_channels_batch(self, channels: List[discord.abc.GuildChannel]) -> int:
+        """
+        Store or update information for multiple channels using bulk upserts.
+        
+        Channels are written in chunks of ``batch_size`` rows, so a guild with
+        hundreds of channels costs a handful of requests instead of one per channel.
+        
+        Args:
+            channels: Discord channel objects to store
+        
+        Returns:
+            Number of successfully stored channels
+        """
+        if not channels:
+            return 0
+        
+        now = datetime.now(timezone.utc)
+        channel_dicts = []
+        for channel in channels:
+            try:
+                model = self._convert_discord_channel(channel, now)
+                channel_dicts.append(self._channel_info_model_to_dict(model))
+            except Exception as e:
+                logger.warning(f"Failed to convert channel {channel.id}: {e}")
+                continue
+        
+        stored_count = 0
+        chunk_size = self.config.batch_size
+        
+        for start in range(0, len(channel_dicts), chunk_size):
+            chunk = channel_dicts[start:start + chunk_size]
+            
+            try:
+                await self._execute_with_retry(
+                    self._upsert_channels,
+                    f"store_channels_batch_{len(chunk)}",
+                    chunk
+                )
+                stored_count += len(chunk)
+            except Exception as e:
+                logger.error(f"Failed to store channel batch of {len(chunk)}: {e}")
+        
+        logger.debug("Stored batch of {} channels", stored_count)
+        return stored_count
+    
+    def _upsert_channels(self, client: Client, channel_dicts: List[Dict[str, Any]]) -> Any:
+        """Build a bulk upsert request for channel rows."""
+        return client.table(self.table_names["channels"]).upsert(
+            channel_dicts,
+            on_conflict="channel_id",
+            returning=ReturnMethod.minimal
+        )
+    
+    def _convert_discord_guild(self, guild: discord.Guild) -> GuildInfoModel:
+        """
+        Convert a Discord guild to a GuildInfoModel for database storage.
+        
+        Args:
+            guild: Discord guild object
+        
+        Returns:
+            GuildInfoModel instance ready for database storage
+        """
+        return GuildInfoModel(
+            guild_id=str(guild.id),
+            name=guild.name,
+            description=guild.description,
+            owner_id=str(guild.owner_id) if guild.owner_id else "0",
+            member_count=guild.member_count or 0,
+            created_at=guild.created_at,
+            icon_url=str(guild.icon.url) if guild.icon else None,
+            banner_url=str(guild.banner.url) if guild.banner else None
+        )
+    
+    def _convert_discord_channel(
+        self, 
+        channel: discord.abc.GuildChannel, 
+        now: Optional[datetime] = None
+    ) -> ChannelInfoModel:
+        """
+        Convert a Discord channel to a ChannelInfoModel for database storage.
+        
+        Args:
+            channel: Discord channel object
+            now: Timestamp for first_seen/last_updated, shared across a batch
+        
+        Returns:
+            ChannelInfoModel instance ready for database storage
+        """
+        now = now or datetime.now(timezone.utc)
+        return ChannelInfoModel(
+            channel_id=str(channel.id),
+            guild_id=str(channel.guild.id) if hasattr(channel, 'guild') and channel.guild else None,
+            name=channel.name,
+            channel_type=str(channel.type),
+            topic=getattr(channel, 'topic', None),
+            position=getattr(channel, 'position', None),
+            category_id=str(channel.category_id) if getattr(channel, 'category_id', None) else None,
+            first_seen=now,
+            last_updated=now
+        )
+    
+    def _convert_discord_message(
+        self, 
+        message: discord.Message, 
+        is_backfilled: bool = False, 
+        logged_at: Optional[datetime] = None
+    ) -> MessageModel:
         """
         Convert a Discord message to a MessageModel for database storage.
         
         Args:
             message: Discord message object
             is_backfilled: Whether this message is being backfilled
+            logged_at: Logging timestamp, shared across a batch
             
         Returns:
             MessageModel instance ready for database storage
@@ -692,7 +1078,8 @@ class SupabaseManager:
             application_id=str(getattr(message, 'application_id', None)) if hasattr(message, 'application_id') else None,
             interaction_type=str(message.interaction.type) if message.interaction else None,
             webhook_id=str(message.webhook_id) if getattr(message, 'webhook_id', None) else None,
-            is_backfilled=is_backfilled
+            is_backfilled=is_backfilled,
+            logged_at=logged_at or datetime.now(timezone.utc)
         )
     
     def _safe_convert_embed_attr(self, attr) -> Optional[Dict[str, Any]]:
@@ -751,9 +1138,12 @@ class SupabaseManager:
             
             stats = {}
             
+            # count="exact" reports the total in the Content-Range header, so the
+            # body only needs a single row rather than every id in the table
+            
             # Get message count
             def get_message_count(client: Client) -> Any:
-                return client.table(self.table_names["messages"]).select("id", count="exact")
+                return client.table(self.table_names["messages"]).select("id", count="exact").limit(1)
             
             result = await self._execute_with_retry(
                 get_message_count,
@@ -763,7 +1153,7 @@ class SupabaseManager:
             
             # Get action count
             def get_action_count(client: Client) -> Any:
-                return client.table(self.table_names["actions"]).select("id", count="exact")
+                return client.table(self.table_names["actions"]).select("id", count="exact").limit(1)
             
             result = await self._execute_with_retry(
                 get_action_count,
@@ -773,7 +1163,7 @@ class SupabaseManager:
             
             # Get guild count
             def get_guild_count(client: Client) -> Any:
-                return client.table(self.table_names["guilds"]).select("id", count="exact")
+                return client.table(self.table_names["guilds"]).select("id", count="exact").limit(1)
             
             result = await self._execute_with_retry(
                 get_guild_count,
@@ -806,15 +1196,12 @@ class SupabaseManager:
         }
         
         try:
-            # Test basic connection
-            await self._test_connection()
-            health_status["database_connected"] = True
-            
-            # Test table access
+            # A single table read proves both connectivity and table access
             def test_tables(client: Client) -> Any:
                 return client.table(self.table_names["messages"]).select("created_at").order("created_at", desc=True).limit(1)
             
             result = await self._execute_with_retry(test_tables, "health_check_tables")
+            health_status["database_connected"] = True
             health_status["tables_accessible"] = True
             
             if result.data:
@@ -865,9 +1252,18 @@ class SupabaseManager:
         """Close the database connection."""
         if self.client:
             logger.info("Closing Supabase connection")
-            # Supabase client doesn't need explicit closing
             self.client = None
             self._initialized = False
+        
+        # Close the pooled session directly rather than through the PostgREST
+        # client: supabase rebuilds client.postgrest on auth state changes, so
+        # client.postgrest.session may no longer be the session created here
+        if self._http_session is not None:
+            try:
+                self._http_session.close()
+            except Exception as e:
+                logger.warning(f"Error closing Supabase HTTP session: {e}")
+            self._http_session = None
     
     def _message_model_to_dict(self, message_model: MessageModel) -> Dict[str, Any]:
         """
@@ -882,9 +1278,6 @@ class SupabaseManager:
         try:
             data = message_model.model_dump()
             
-            # Debug: Log the original data types
-            logger.debug(f"Original data types: {[(k, type(v)) for k, v in data.items()]}")
-            
             # Recursively convert all datetime objects to strings
             data = self._convert_datetime_recursive(data)
             
@@ -892,15 +1285,8 @@ class SupabaseManager:
             if 'message_type' in data:
                 if hasattr(data['message_type'], 'value'):
                     data['message_type'] = data['message_type'].value
-                    logger.debug(f"Converted message_type enum to string: {data['message_type']}")
-                elif isinstance(data['message_type'], str):
-                    logger.debug(f"message_type is already a string: {data['message_type']}")
-                else:
+                elif not isinstance(data['message_type'], str):
                     data['message_type'] = 'default'
-                    logger.debug(f"Set message_type to default: {data['message_type']}")
-            
-            # Debug: Log the final data types
-            logger.debug(f"Final data types: {[(k, type(v)) for k, v in data.items()]}")
             
             return data
             
@@ -1005,15 +1391,6 @@ class SupabaseManager:
         Returns:
             Dictionary with datetime objects converted to ISO format strings
         """
-        data = action_model.model_dump()
-        
-        # Convert datetime objects to ISO format strings
-        if data.get('occurred_at'):
-            data['occurred_at'] = data['occurred_at'].isoformat()
-        if data.get('logged_at'):
-            data['logged_at'] = data['logged_at'].isoformat()
-        
-        # Convert enum values to strings
-        data['action_type'] = data['action_type'].value
-        
-        return data 
\ No newline at end of file
+        # JSON mode converts datetimes (including ones nested in the
+        # before/after/action payloads) and the enum in a single pass
+        return action_model.model_dump(mode="json") 
\ No newline at end of file
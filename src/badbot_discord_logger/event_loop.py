@@ -0,0 +1,49 @@
+"""
+Event loop selection for the bot's entry points.
+
+Kept apart from the bot so main.py and cli.py can pick a loop policy
+without importing discord.py.
+"""
+
+import asyncio
+import sys
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop's event loop for subsequent asyncio.run() calls if available.
+    
+    uvloop is an optional dependency (not built for Windows); without it the
+    default asyncio loop is used.
+    
+    Returns:
+        True if uvloop was installed, False otherwise
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def configure_event_loop_policy() -> str:
+    """
+    Pin the asyncio event loop policy for the current platform.
+    
+    On Windows the Proactor loop is used, since the selector loop cannot run
+    subprocesses. Elsewhere uvloop is used when it is installed, falling back
+    to the default asyncio loop.
+    
+    Returns:
+        Name of the selected loop implementation
+    """
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+        return "proactor"
+    
+    if install_uvloop():
+        return "uvloop"
+    
+    return "asyncio"
@@ -0,0 +1,178 @@
+"""
+Unit tests for the bot module.
+
+This module tests the queueing and batching helpers of the logger bot without
+connecting to Discord or the database.
+"""
+
+import asyncio
+import time
+from functools import partial
+from types import SimpleNamespace
+
+import pytest
+
+from badbot_discord_logger.bot import BoundedIdSet, DiscordLogger, coalesce_update_actions
+from badbot_discord_logger.models import ActionType
+
+
+def make_bot(**config):
+    """Build a stand-in for DiscordLogger carrying just the state under test."""
+    defaults = {"batch_size": 10, "flush_interval": 0}
+    defaults.update(config)
+    return SimpleNamespace(
+        config=SimpleNamespace(**defaults),
+        stats={"errors": 0},
+    )
+
+
+def make_action(action_type, target_id=None, user_id=None, before=None, after=None, data=None):
+    """Build a queued action dict as _queue_action does."""
+    return {
+        "action_type": action_type,
+        "guild_id": 1,
+        "channel_id": None,
+        "user_id": user_id,
+        "target_id": target_id,
+        "action_data": data,
+        "before_data": before,
+        "after_data": after,
+    }
+
+
+def voice_update(before_channel, after_channel, self_mute=False):
+    """Build a voice state update for user 7."""
+    return make_action(
+        ActionType.VOICE_STATE_UPDATE,
+        user_id=7,
+        before={"channel_id": before_channel, "self_mute": False},
+        after={"channel_id": after_channel, "self_mute": self_mute},
+    )
+
+
+class TestCoalesceUpdateActions:
+    """Test merging of repeated update actions."""
+    
+    def test_keeps_earliest_before_and_latest_after(self):
+        """Test merged updates span the earliest before and latest after state."""
+        actions = [
+            make_action(
+                ActionType.MEMBER_UPDATE, target_id=5,
+                before={"nick": "a"}, after={"nick": "b"},
+                data={"nick": {"before": "a", "after": "b"}},
+            ),
+            make_action(
+                ActionType.MEMBER_UPDATE, target_id=5,
+                before={"nick": "b"}, after={"nick": "c"},
+                data={"nick": {"before": "b", "after": "c"}},
+            ),
+        ]
+        
+        result = coalesce_update_actions(actions)
+        
+        assert len(result) == 1
+        assert result[0]["before_data"] == {"nick": "a"}
+        assert result[0]["after_data"] == {"nick": "c"}
+        assert result[0]["action_data"] == {"nick": {"before": "a", "after": "c"}}
+    
+    def test_merged_action_keeps_first_position(self):
+        """Test a merged update stays where it first occurred."""
+        actions = [
+            make_action(ActionType.MEMBER_UPDATE, target_id=5, after={"nick": "b"}),
+            make_action(ActionType.MEMBER_JOIN, target_id=6),
+            make_action(ActionType.MEMBER_UPDATE, target_id=5, after={"nick": "c"}),
+        ]
+        
+        result = coalesce_update_actions(actions)
+        
+        assert [action["action_type"] for action in result] == [
+            ActionType.MEMBER_UPDATE, ActionType.MEMBER_JOIN
+        ]
+        assert result[0]["after_data"] == {"nick": "c"}
+    
+    def test_create_and_delete_pass_through(self):
+        """Test non-update actions on the same target are never merged."""
+        actions = [
+            make_action(ActionType.CHANNEL_CREATE, target_id=9, after={"name": "x"}),
+            make_action(ActionType.CHANNEL_DELETE, target_id=9, before={"name": "x"}),
+            make_action(ActionType.CHANNEL_CREATE, target_id=9, after={"name": "x"}),
+        ]
+        
+        assert coalesce_update_actions(actions) == actions
+    
+    def test_voice_channel_changes_are_not_merged(self):
+        """Test voice joins, moves and leaves are each kept."""
+        actions = [voice_update(None, "A"), voice_update("A", "B"), voice_update("B", None)]
+        
+        assert coalesce_update_actions(actions) == actions
+    
+    def test_voice_updates_merge_within_a_channel(self):
+        """Test voice updates within one channel merge, but not across channels."""
+        actions = [
+            voice_update("A", "A", self_mute=True),
+            voice_update("A", "A"),
+            voice_update("A", "B"),
+            voice_update("B", "B", self_mute=True),
+        ]
+        
+        result = coalesce_update_actions(actions)
+        
+        assert len(result) == 3
+        assert result[0]["after_data"] == {"channel_id": "A", "self_mute": False}
+        assert result[1] == actions[2]
+        assert result[2] == actions[3]
+
+
+class TestQueueMessage:
+    """Test queueing messages onto a bounded queue."""
+    
+    def test_full_queue_drops_oldest(self):
+        """Test a full queue drops its oldest message and counts the drop."""
+        bot = make_bot()
+        bot.stats["items_dropped"] = 0
+        bot.message_queue = asyncio.Queue(maxsize=2)
+        bot.processed_messages = BoundedIdSet(100)
+        bot._enqueue = partial(DiscordLogger._enqueue, bot)
+        
+        for message_id in (1, 2, 3, 4):
+            DiscordLogger._queue_message(bot, SimpleNamespace(id=message_id))
+        
+        assert bot.stats["items_dropped"] == 2
+        queued = [bot.message_queue.get_nowait()[1].id for _ in range(2)]
+        assert queued == [3, 4]
+        assert 1 not in bot.processed_messages
+        assert 2 not in bot.processed_messages
+        assert 3 in bot.processed_messages
+        assert 4 in bot.processed_messages
+
+
+class TestBatchConsumer:
+    """Test the queue batch consumer."""
+    
+    def test_cancel_mid_flush_stores_batch(self):
+        """Test cancelling a consumer mid-flush still stores the batch."""
+        stored = []
+        
+        async def run():
+            queue = asyncio.Queue()
+            flushing = asyncio.Event()
+            
+            async def process_batch(batch):
+                flushing.set()
+                await asyncio.sleep(0.05)
+                stored.append(batch)
+            
+            for item in ("a", "b"):
+                queue.put_nowait((time.monotonic(), item))
+            
+            consumer = asyncio.create_task(
+                DiscordLogger._batch_consumer(make_bot(), queue, process_batch)
+            )
+            await flushing.wait()
+            consumer.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await consumer
+        
+        asyncio.run(run())
+        
+        assert stored == [["a", "b"]]